@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class ApiConfig(AppConfig):
     name = "catalog.api"
     default_auto_field = "django.db.models.AutoField"
+
+    def ready(self):
+        # Connect the signal receivers that invalidate cached token info.
+        from catalog.api.utils import oauth2_helper  # noqa: F401
@@ -1,33 +1,43 @@
-AUDIO_CATEGORIES = {
-    "audiobook",
-    "music",
-    "news",
-    "podcast",
-    "pronunciation",
-    "sound_effect",
-}
+AUDIO_CATEGORIES = frozenset(
+    {
+        "audiobook",
+        "music",
+        "news",
+        "podcast",
+        "pronunciation",
+        "sound_effect",
+    }
+)
 
-IMAGE_CATEGORIES = {
-    "digitized_artwork",
-    "illustration",
-    "photograph",
-}
+IMAGE_CATEGORIES = frozenset(
+    {
+        "digitized_artwork",
+        "illustration",
+        "photograph",
+    }
+)
 
-ASPECT_RATIOS = {
-    "tall",
-    "wide",
-    "square",
-}
+ASPECT_RATIOS = frozenset(
+    {
+        "tall",
+        "wide",
+        "square",
+    }
+)
 
-IMAGE_SIZES = {
-    "small",
-    "medium",
-    "large",
-}
+IMAGE_SIZES = frozenset(
+    {
+        "small",
+        "medium",
+        "large",
+    }
+)
 
-LENGTHS = {
-    "shortest",
-    "short",
-    "medium",
-    "long",
-}
+LENGTHS = frozenset(
+    {
+        "shortest",
+        "short",
+        "medium",
+        "long",
+    }
+)
@@ -195,11 +195,7 @@ class AudioSearchSerializer(MediaSearchSerializer):
 
 
 class AudioWaveformSerializer(serializers.Serializer):
-    len = serializers.SerializerMethodField()
+    len = serializers.IntegerField()
     points = serializers.ListField(
         child=serializers.FloatField(min_value=0, max_value=1)
     )
-
-    @staticmethod
-    def get_len(obj) -> int:
-        return len(obj.get("points", []))
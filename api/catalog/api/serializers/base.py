@@ -1,3 +1,6 @@
+import copy
+
+from django.db import models
 from rest_framework import serializers
 
 
@@ -22,3 +25,88 @@ class BaseModelSerializer(serializers.ModelSerializer):
         if doc := getattr(model_class, field_name).__doc__:
             kwargs.setdefault("help_text", doc)
         return klass, kwargs
+
+
+class CachedFieldsMixin:
+    """
+    Build the fields of a serializer once per class instead of once per instance.
+
+    DRF deep-copies every declared field, re-running its ``__init__``, whenever a
+    serializer is instantiated. This mixin builds the fields on first use, stores
+    them on the class and gives every instance shallow copies that are then bound
+    to it as usual.
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        if "_cached_fields" not in cls.__dict__:
+            cls._cached_fields = super().get_fields()
+        return {
+            name: self._copy_field(field) for name, field in cls._cached_fields.items()
+        }
+
+    @classmethod
+    def _copy_field(cls, field):
+        """
+        Make a shallow copy of the field that can be bound to a new parent.
+
+        State that ties the field to its previous parent, i.e. the child of list
+        fields and the fields of nested serializers, is reset on the copy.
+
+        :param field: the unbound field built by ``get_fields``
+        :return: a copy of the field safe to bind to another serializer
+        """
+
+        new = copy.copy(field)
+        new.__dict__.pop("fields", None)
+        if child := getattr(field, "child", None):
+            new.child = cls._copy_field(child)
+            new.child.parent = new
+        return new
+
+
+class CachedListSerializer(serializers.ListSerializer):
+    """
+    Serialize a list of items, reusing the representation of repeated items.
+
+    The cache lives only as long as a single call to ``to_representation``, i.e.
+    for the duration of one response.
+    """
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        cache = {}
+        output = []
+        for item in iterable:
+            key = self.child.get_cache_key(item)
+            if key not in cache:
+                cache[key] = self.child.to_representation(item)
+            output.append(cache[key])
+        return output
+
+
+class SerializerCacheMixin:
+    """
+    Use ``CachedListSerializer`` when the serializer is instantiated with ``many``.
+
+    Subclasses that specify their own ``list_serializer_class`` keep using it.
+    """
+
+    cached_list_serializer_class = CachedListSerializer
+    """the list serializer, a subclass of ``CachedListSerializer``, to use"""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        meta = cls.__dict__.get("Meta")
+        if meta is not None and not hasattr(meta, "list_serializer_class"):
+            meta.list_serializer_class = cls.cached_list_serializer_class
+
+    def get_cache_key(self, instance):
+        """
+        Get the key identifying the instance among the items being serialized.
+
+        :param instance: the item being serialized
+        :return: a hashable key, equal for items with the same representation
+        """
+
+        return id(instance)
@@ -1,11 +1,38 @@
 import re
+from collections.abc import Iterable
+from functools import lru_cache
 
 from django.conf import settings
 from rest_framework import serializers
+from rest_framework.reverse import reverse
 
 from catalog.api.utils.help_text import make_comma_separated_help_text
 
 
+_LOOKUP_PLACEHOLDER = "ffffffff-ffff-4fff-bfff-ffffffffffff"
+"""a UUID that satisfies ``lookup_value_regex``, substituted in URL templates"""
+
+
+@lru_cache(maxsize=None)
+def _get_path_template(
+    view_name: str, lookup_url_kwarg: str, version: str | None, url_format: str | None
+) -> str:
+    """
+    Reverse the path of the view once, with a placeholder for the lookup value.
+
+    :param view_name: the name of the view to reverse
+    :param lookup_url_kwarg: the URL keyword argument identifying the object
+    :param version: the API version of the request, if any
+    :param url_format: the format suffix of the URL, if any
+    :return: the path containing ``_LOOKUP_PLACEHOLDER`` as the lookup value
+    """
+
+    kwargs = {lookup_url_kwarg: _LOOKUP_PLACEHOLDER}
+    if version is not None:
+        kwargs["version"] = version
+    return reverse(view_name, kwargs=kwargs, format=url_format)
+
+
 class SchemableHyperlinkedIdentityField(serializers.HyperlinkedIdentityField):
     """
     This field returns the link but allows the option to replace the URL scheme.
@@ -18,15 +45,49 @@ class SchemableHyperlinkedIdentityField(serializers.HyperlinkedIdentityField):
         super().__init__(*args, **kwargs)
 
         self.scheme = scheme
+        # the request, path and URL template last built by ``_get_url_template``
+        self._url_template: tuple[object, str, str] | None = None
+
+    def _get_url_template(self, path: str, request) -> str:
+        """
+        Build the absolute URL template for the path, with the scheme replaced.
 
-    def get_url(self, *args, **kwargs):
-        url = super().get_url(*args, **kwargs)
+        The template is kept on the field, which serializes every row of a response
+        with the same request, so this work is done once per response.
 
+        :param path: the path template containing ``_LOOKUP_PLACEHOLDER``
+        :param request: the request for which the URL is being built
+        :return: the absolute URL template containing ``_LOOKUP_PLACEHOLDER``
+        """
+
+        if self._url_template is not None:
+            cached_request, cached_path, template = self._url_template
+            if cached_request is request and cached_path == path:
+                return template
+
+        template = request.build_absolute_uri(path)
         # Only rewrite URLs if a fixed scheme is provided
         if self.scheme is not None:
-            url = re.sub(r"^\w+://", f"{self.scheme}://", url, 1)
-
-        return url
+            template = re.sub(r"^\w+://", f"{self.scheme}://", template, 1)
+        self._url_template = (request, path, template)
+        return template
+
+    def get_url(self, obj, view_name, request, format):
+        if hasattr(obj, "pk") and obj.pk in (None, ""):
+            return None
+
+        # Reversing the URL for every object is costly, so the path is reversed
+        # once per view and the lookup value is substituted into it.
+        path = _get_path_template(
+            view_name,
+            self.lookup_url_kwarg,
+            getattr(request, "version", None),
+            format,
+        )
+        lookup_value = str(getattr(obj, self.lookup_field))
+        return self._get_url_template(path, request).replace(
+            _LOOKUP_PLACEHOLDER, lookup_value
+        )
 
 
 class EnumCharField(serializers.CharField):
@@ -36,11 +97,12 @@ class EnumCharField(serializers.CharField):
         "outside_enum": "Invalid value: {given}. Allowed values: {allowed}"
     }
 
-    def __init__(self, plural: str, enum_class: set[str], **kwargs):
+    def __init__(self, plural: str, enum_class: Iterable[str], **kwargs):
         kwargs["help_text"] = make_comma_separated_help_text(enum_class, plural)
         super().__init__(**kwargs)
 
-        self.enum_class = enum_class
+        self.enum_class = frozenset(enum_class)
+        self._allowed = ", ".join(sorted(self.enum_class))
 
     def _validate_enum(self, given_value: str):
         """
@@ -55,7 +117,7 @@ class EnumCharField(serializers.CharField):
         input_values = lower.split(",")
         for value in input_values:
             if value not in self.enum_class:
-                self.fail("outside_enum", given=value, allowed=self.enum_class)
+                self.fail("outside_enum", given=value, allowed=self._allowed)
         return lower
 
     def to_internal_value(self, data):
@@ -1,4 +1,5 @@
 from collections import namedtuple
+from functools import lru_cache
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
@@ -15,13 +16,34 @@ from catalog.api.constants.sorting import (
 )
 from catalog.api.controllers import search_controller
 from catalog.api.models.media import AbstractMedia
-from catalog.api.serializers.base import BaseModelSerializer
+from catalog.api.serializers.base import (
+    BaseModelSerializer,
+    CachedFieldsMixin,
+    CachedListSerializer,
+    SerializerCacheMixin,
+)
 from catalog.api.serializers.fields import SchemableHyperlinkedIdentityField
 from catalog.api.utils.help_text import make_comma_separated_help_text
 from catalog.api.utils.licenses import get_license_url
 from catalog.api.utils.url import add_protocol
 
 
+@lru_cache(maxsize=256)
+def _intersect_license_groups(license_types: frozenset[str]) -> str:
+    """
+    Get the comma-separated licenses common to all the given license types.
+
+    The number of possible combinations of license types is small, so the
+    result is cached to skip the set intersection on repeated requests.
+
+    :param license_types: the set of valid license types to intersect
+    :return: the comma-separated licenses belonging to every license type
+    """
+
+    intersected = set.intersection(*(LICENSE_GROUPS[_type] for _type in license_types))
+    return ",".join(sorted(intersected))
+
+
 #######################
 # Request serializers #
 #######################
@@ -181,15 +203,14 @@ class MediaSearchRequestSerializer(serializers.Serializer):
         """Check whether license type is a known collection of licenses."""
 
         license_types = value.lower().split(",")
-        license_groups = []
         for _type in license_types:
             if _type not in LICENSE_GROUPS:
                 raise serializers.ValidationError(
                     f"License type '{_type}' does not exist."
                 )
-            license_groups.append(LICENSE_GROUPS[_type])
-        intersected = set.intersection(*license_groups)
-        return ",".join(intersected)
+        if len(license_types) == 1:
+            return ",".join(sorted(LICENSE_GROUPS[license_types[0]]))
+        return _intersect_license_groups(frozenset(license_types))
 
     def validate_creator(self, value):
         return self._truncate(value)
@@ -293,10 +314,8 @@ class MediaReportRequestSerializer(serializers.ModelSerializer):
         read_only_fields = ["identifier"]
 
     def validate(self, attrs):
-        if (
-            attrs["reason"] == "other"
-            and ("description" not in attrs or len(attrs["description"])) < 20
-        ):
+        description = attrs.get("description") or ""
+        if attrs["reason"] == "other" and len(description) < 20:
             raise serializers.ValidationError(
                 "Description must be at least be 20 characters long"
             )
@@ -343,7 +362,48 @@ class MediaSearchSerializer(serializers.Serializer):
     # ``results`` field added by child serializers
 
 
-class MediaSerializer(BaseModelSerializer):
+def _normalize_media_representation(output: dict):
+    """
+    Clean up the representation of a media item in place.
+
+    :param output: the representation produced by ``MediaSerializer``
+    """
+
+    # Ensure lists are ``[]`` instead of ``None``
+    # TODO: These fields are still marked 'Nullable' in the API docs
+    for list_field in ("tags", "fields_matched"):
+        if output[list_field] is None:
+            output[list_field] = []
+
+    # Ensure license is lowercase
+    output["license"] = output["license"].lower()
+
+    if output["license_url"] is None:
+        output["license_url"] = get_license_url(
+            output["license"], output["license_version"]
+        )
+
+    # Ensure URLs have scheme
+    for url_field in ("url", "creator_url", "foreign_landing_url"):
+        output[url_field] = add_protocol(output[url_field])
+
+
+class MediaListSerializer(CachedListSerializer):
+    """
+    This serializer serializes a list of media files.
+
+    The items are normalized in a single pass over the list once all of them have
+    been serialized.
+    """
+
+    def to_representation(self, data):
+        output = super().to_representation(data)
+        for row in output:
+            _normalize_media_representation(row)
+        return output
+
+
+class MediaSerializer(SerializerCacheMixin, CachedFieldsMixin, BaseModelSerializer):
     """
     This serializer serializes a single media file.
 
@@ -381,6 +441,8 @@ class MediaSerializer(BaseModelSerializer):
     needs_db = False
     """whether the serializer needs fields from the DB to process results"""
 
+    cached_list_serializer_class = MediaListSerializer
+
     id = serializers.CharField(
         help_text="Our unique identifier for an open-licensed work.",
         source="identifier",
@@ -406,28 +468,15 @@ class MediaSerializer(BaseModelSerializer):
         help_text="Whether the media item is marked as mature",
     )
 
+    def get_cache_key(self, instance):
+        return str(instance.identifier)
+
     def to_representation(self, *args, **kwargs):
         output = super().to_representation(*args, **kwargs)
 
-        # Ensure lists are ``[]`` instead of ``None``
-        # TODO: These fields are still marked 'Nullable' in the API docs
-        list_fields = ["tags", "fields_matched"]
-        for list_field in list_fields:
-            if output[list_field] is None:
-                output[list_field] = []
-
-        # Ensure license is lowercase
-        output["license"] = output["license"].lower()
-
-        if output["license_url"] is None:
-            output["license_url"] = get_license_url(
-                output["license"], output["license_version"]
-            )
-
-        # Ensure URLs have scheme
-        url_fields = ["url", "creator_url", "foreign_landing_url"]
-        for url_field in url_fields:
-            output[url_field] = add_protocol(output[url_field])
+        # Lists of items are normalized by ``MediaListSerializer``
+        if not isinstance(self.parent, MediaListSerializer):
+            _normalize_media_representation(output)
 
         return output
 
@@ -31,31 +31,13 @@ def get_attribution_text(
 
     is_pd = is_public_domain(_license)
 
-    title = f'"{title}"' if title else "This work"
-    _license = get_full_license_name(_license, license_version)
-
-    attribution = "{title} {creator} {marked-licensed} {license}. {view-legal}"
-    attribution_parts = {
-        "title": title,
-        "marked-licensed": "is marked with" if is_pd else "is licensed under",
-        "license": _license,
-        "view-legal": "",
-        "creator": "",
-    }
-
+    title_part = f'"{title}"' if title else "This work"
+    creator_part = f" by {creator}" if creator else ""
+    marked_licensed = "is marked with" if is_pd else "is licensed under"
+    license_name = get_full_license_name(_license, license_version)
+    view_legal = ""
     if license_url:
-        view_legal_temp = "To view {terms-copy}, visit {url}."
-        view_legal_parts = {
-            "terms-copy": "the terms" if is_pd else "a copy of this license",
-            "url": license_url,
-        }
-        attribution_parts["view-legal"] = view_legal_temp.format(**view_legal_parts)
-
-    if creator:
-        creator_temp = "by {creator-name}"
-        creator_parts = {"creator-name": creator}
-        attribution_parts["creator"] = creator_temp.format(**creator_parts)
-
-    attribution = attribution.format(**attribution_parts)
+        terms_copy = "the terms" if is_pd else "a copy of this license"
+        view_legal = f" To view {terms_copy}, visit {license_url}."
 
-    return attribution.strip().replace("  ", " ")
+    return f"{title_part}{creator_part} {marked_licensed} {license_name}.{view_legal}"
@@ -1,6 +1,7 @@
 from deepdiff import DeepHash
 from django_redis import get_redis_connection
 from elasticsearch_dsl import Search
+from redis.client import Pipeline
 
 
 # 3 hours minutes (in seconds)
@@ -37,17 +38,22 @@ def get_query_mask(query_hash: str) -> list[int]:
     return list(map(int, redis.lrange(key, 0, -1)))
 
 
-def save_query_mask(query_hash: str, mask: list):
+def save_query_mask(query_hash: str, mask: list, redis_pipe: Pipeline | None = None):
     """
     Save a query mask to redis.
 
     :param mask: Boolean mask as a list of integers (0 or 1).
     :param query_hash: Unique value to be used as key.
+    :param redis_pipe: An existing pipeline to queue the commands on, letting the
+    caller send them along with its own; if omitted, they are executed immediately.
     """
-    redis_pipe = get_redis_connection("default").pipeline()
+    execute = redis_pipe is None
+    if execute:
+        redis_pipe = get_redis_connection("default").pipeline()
     key = f"{query_hash}:dead_link_mask"
 
     redis_pipe.delete(key)
     redis_pipe.rpush(key, *mask)
     redis_pipe.expire(key, DEAD_LINK_MASK_TTL)
-    redis_pipe.execute()
+    if execute:
+        redis_pipe.execute()
@@ -1,4 +1,5 @@
 from collections.abc import Iterable
+from functools import lru_cache
 
 
 def make_comma_separated_help_text(items: Iterable[str], name: str) -> str:
@@ -8,12 +9,20 @@ def make_comma_separated_help_text(items: Iterable[str], name: str) -> str:
     Items are wrapped in backticks, and lists with more than one item will
     have an "and" added before the final item.
 
+    DRF re-runs field constructors whenever it deep-copies declared fields, so the
+    text is cached for each distinct set of items.
+
     :param items: iterable of available options for this field
     :param name: plural name of the list of items (e.g. "categories", "aspect ratios")
     :return: generated help text
     """
 
-    formatted = [f"`{item}`" for item in sorted(items)]
+    return _make_comma_separated_help_text(tuple(sorted(items)), name)
+
+
+@lru_cache(maxsize=None)
+def _make_comma_separated_help_text(items: tuple[str, ...], name: str) -> str:
+    formatted = [f"`{item}`" for item in items]
     # Add an "and" at the end of the list
     if len(formatted) > 1:
         formatted[-1] = f"and {formatted[-1]}"
@@ -5,6 +5,7 @@ For any changes made here, please make the corresponding changes in the
 frontend, or open an issue to track it.
 """
 
+from functools import lru_cache
 
 from catalog.api.constants.licenses import (
     ALL_CC_LICENSES,
@@ -33,10 +34,13 @@ def get_license_url(_license: str, license_version: str | None) -> str:
     return f"https://creativecommons.org/{fragment}/"
 
 
+@lru_cache(maxsize=128)
 def get_full_license_name(_license: str, license_version: str | None) -> str:
     """
     Get the readable full name of the license from the license slug and version.
 
+    There are few license-version pairs, so the names are cached.
+
     :param _license: the slug of the license
     :param license_version: the version number of the license
     :return: the full name of the license
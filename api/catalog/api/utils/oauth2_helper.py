@@ -1,6 +1,13 @@
 import datetime as dt
+import hashlib
+import json
 import logging
+from collections.abc import Iterable
 
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+import django_redis
 from oauth2_provider.models import AccessToken
 
 from catalog.api import models
@@ -11,32 +18,82 @@ parent_logger = logging.getLogger(__name__)
 _no_result = (None, None, None)
 
 
+def _get_cache_key(token: str) -> str:
+    digest = hashlib.sha256(token.encode()).hexdigest()
+    return f"token-info:{digest}"
+
+
+def invalidate_token_info(tokens: Iterable[str]):
+    """
+    Remove the cached information of the given access tokens.
+
+    :param tokens: the OAuth2 access tokens whose information has changed
+    """
+
+    keys = [_get_cache_key(token) for token in tokens]
+    if keys:
+        django_redis.get_redis_connection("default").delete(*keys)
+
+
+def invalidate_application_token_info(application_pk: int):
+    """
+    Remove the cached information of all access tokens issued to an application.
+
+    :param application_pk: the primary key of the changed ``ThrottledApplication``
+    """
+
+    invalidate_token_info(
+        AccessToken.objects.filter(application_id=application_pk).values_list(
+            "token", flat=True
+        )
+    )
+
+
+@receiver(post_save, sender=AccessToken)
+@receiver(post_delete, sender=AccessToken)
+def _on_access_token_change(sender, instance, **kwargs):
+    invalidate_token_info([instance.token])
+
+
+@receiver(post_save, sender=models.ThrottledApplication)
+@receiver(post_delete, sender=models.ThrottledApplication)
+def _on_application_change(sender, instance, **kwargs):
+    invalidate_application_token_info(instance.pk)
+
+
 def get_token_info(token: str):
     """
     Recover an OAuth2 application client ID and rate limit model from an access token.
 
+    The information of valid tokens is cached in Redis until the token expires so
+    that the database is only queried the first time a token is seen.
+
     :param token: An OAuth2 access token.
     :return: If the token is valid, return the client ID associated with the
     token, rate limit model, and email verification status as a tuple; else
     return ``(None, None, None)``.
     """
     logger = parent_logger.getChild("get_token_info")
+    redis = django_redis.get_redis_connection("default")
+    cache_key = _get_cache_key(token)
+    if (cached := redis.get(cache_key)) is not None:
+        return tuple(json.loads(cached))
+
     try:
-        token = AccessToken.objects.get(token=token)
+        token = AccessToken.objects.select_related("application").get(token=token)
     except AccessToken.DoesNotExist:
         return _no_result
 
-    try:
-        application = models.ThrottledApplication.objects.get(accesstoken=token)
-    except models.ThrottledApplication.DoesNotExist:
+    application: models.ThrottledApplication | None = token.application
+    if application is None:
         # Critical because it indicates a data integrity problem.
         # In practice should never occur so long as the preceeding
         # operation to retrieve the access token was successful.
         logger.critical("Failed to find application associated with access token.")
         return _no_result
 
-    expired = token.expires < dt.datetime.now(token.expires.tzinfo)
-    if expired:
+    time_to_expiry = token.expires - dt.datetime.now(token.expires.tzinfo)
+    if time_to_expiry <= dt.timedelta(0):
         logger.info(
             "rejected expired access token "
             f"application.name={application.name} "
@@ -47,4 +104,10 @@ def get_token_info(token: str):
     client_id = str(application.client_id)
     rate_limit_model = application.rate_limit_model
     verified = application.verified
-    return client_id, rate_limit_model, verified
+    token_info = (client_id, rate_limit_model, verified)
+    redis.set(
+        cache_key,
+        json.dumps(token_info),
+        ex=max(int(time_to_expiry.total_seconds()), 1),
+    )
+    return token_info
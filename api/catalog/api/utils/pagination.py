@@ -12,12 +12,13 @@ class StandardPagination(PageNumberPagination):
         self.result_count = None  # populated later
         self.page_count = None  # populated later
         self.page = 1  # default, get's updated when necessary
+        self.max_pagination_depth = settings.MAX_PAGINATION_DEPTH
 
     def get_paginated_response(self, data):
         return Response(
             {
                 "result_count": self.result_count,
-                "page_count": min(settings.MAX_PAGINATION_DEPTH, self.page_count),
+                "page_count": min(self.max_pagination_depth, self.page_count),
                 "page_size": self.page_size,
                 "page": self.page,
                 "results": data,
@@ -1,14 +1,21 @@
+import atexit
 import logging
-from urllib.parse import urlparse
+import threading
+import time
+from collections import Counter
+from functools import lru_cache
+from urllib.parse import urlsplit
 
 from django.conf import settings
-from django.http import HttpResponse
+from django.http import StreamingHttpResponse
 from rest_framework import status
 from rest_framework.exceptions import APIException
 
 import django_redis
 import requests
 import sentry_sdk
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ReadTimeoutError
 
 
 parent_logger = logging.getLogger(__name__)
@@ -26,13 +33,146 @@ HEADERS = {
     )
 }
 
+_session = requests.Session()
+"""All thumbnails are requested from Photon so keep the connections alive."""
+_session.headers.update(HEADERS)
+_session.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=256))
+
+
+TIMEOUT_COUNT_FLUSH_INTERVAL = 5
+"""Seconds between flushes of the locally counted timeouts to Redis."""
+
+_timeout_counts: Counter[str] = Counter()
+_timeout_counts_lock = threading.Lock()
+_timeout_count_flusher: threading.Thread | None = None
+
+
+def _count_timeout(domain: str):
+    """
+    Count a Photon timeout for the given provider domain.
+
+    Counts are kept in memory and periodically added to Redis by a background
+    thread so that an outage does not also cause a Redis write per request.
+
+    :param domain: the domain of the media file that timed out
+    """
+
+    global _timeout_count_flusher
+    with _timeout_counts_lock:
+        _timeout_counts[domain] += 1
+        if _timeout_count_flusher is None:
+            _timeout_count_flusher = threading.Thread(
+                target=_flush_timeout_counts_periodically,
+                name="photon-timeout-counts",
+                daemon=True,
+            )
+            _timeout_count_flusher.start()
+            atexit.register(_flush_timeout_counts)
+
+
+def _flush_timeout_counts():
+    with _timeout_counts_lock:
+        counts = _timeout_counts.copy()
+        _timeout_counts.clear()
+    if not counts:
+        return
+
+    pipe = django_redis.get_redis_connection("default").pipeline()
+    for domain, count in counts.items():
+        pipe.incrby(f"{settings.THUMBNAIL_TIMEOUT_PREFIX}{domain}", count)
+    pipe.execute()
+
+
+def _flush_timeout_counts_periodically():
+    logger = parent_logger.getChild("_flush_timeout_counts_periodically")
+    while True:
+        time.sleep(TIMEOUT_COUNT_FLUSH_INTERVAL)
+        try:
+            _flush_timeout_counts()
+        except Exception as exc:
+            logger.warning(f"Failed to flush thumbnail timeout counts: {exc}")
+
+
+@lru_cache(maxsize=8192)
+def _split_url(url: str) -> tuple[str, str, str, str]:
+    """
+    Split a URL into its scheme, domain, path and query.
+
+    This is a cheaper equivalent of ``urlsplit`` for the absolute URLs of media
+    files, which falls back to ``urlsplit`` for anything else.
+
+    :param url: the URL to split
+    :return: the scheme, domain, path and query of the URL
+    """
+
+    scheme, sep, rest = url.partition("://")
+    if not sep or not scheme.isalpha():
+        parsed = urlsplit(url)
+        return parsed.scheme, parsed.netloc, parsed.path, parsed.query
+
+    rest = rest.partition("#")[0]
+    rest, _, query = rest.partition("?")
+    domain, slash, path = rest.partition("/")
+    return scheme.lower(), domain, slash + path, query
+
+
+@lru_cache(maxsize=16)
+def _get_headers(accept_header: str, auth_key: str | None) -> dict[str, str]:
+    """
+    Get the per-request headers to send to Photon.
+
+    The ``User-Agent`` is set on the session; the ``Accept`` header is forwarded
+    from the client and takes very few distinct values, so the dicts are cached.
+    Callers must not mutate the returned dict.
+
+    :param accept_header: the ``Accept`` header of the thumbnail request
+    :param auth_key: the Photon authentication key, if any
+    :return: the headers to send along with the request
+    """
+
+    headers = {"Accept": accept_header}
+    if auth_key:
+        headers["X-Photon-Authentication"] = auth_key
+    return headers
+
+
+def _stream_content(upstream_response: requests.Response, domain: str):
+    """
+    Stream the body of the Photon response, releasing its connection at the end.
+
+    The body is only read once ``get`` has returned the response, so failures to
+    read it are handled here. The status has been sent by then, so the exception is
+    re-raised to abort the response rather than end it as if it were complete.
+
+    :param upstream_response: the streamed response from Photon
+    :param domain: the domain of the media file, to count timeouts against
+    """
+
+    logger = parent_logger.getChild("_stream_content")
+    try:
+        yield from upstream_response.iter_content(chunk_size=64 * 1024)
+    except requests.RequestException as exc:
+        # ``iter_content`` raises read timeouts as ``ConnectionError``.
+        if isinstance(exc, requests.ReadTimeout) or isinstance(
+            exc.__context__, ReadTimeoutError
+        ):
+            _count_timeout(domain)
+            logger.warning(f"Timed out reading thumbnail from {domain}: {exc}")
+        else:
+            logger.warning(f"Failed to read thumbnail from {domain}: {exc}")
+        sentry_sdk.capture_exception(exc)
+        raise UpstreamThumbnailException(f"Failed to render thumbnail: {exc}")
+    finally:
+        # Release the connection back to the pool once Django closes the response.
+        upstream_response.close()
+
 
 def get(
     image_url: str,
     accept_header: str = "image/*",
     is_full_size: bool = False,
     is_compressed: bool = True,
-) -> HttpResponse:
+) -> StreamingHttpResponse:
     logger = parent_logger.getChild("get")
     # Photon options documented here:
     # https://developer.wordpress.com/docs/photon/api/
@@ -44,15 +184,15 @@ def get(
     if is_compressed:
         params["quality"] = settings.THUMBNAIL_QUALITY
 
-    parsed_image_url = urlparse(image_url)
+    scheme, domain, path, query = _split_url(image_url)
 
-    if parsed_image_url.query:
+    if query:
         # No need to URL encode this string because requests will already
         # pass the `params` object to `urlencode` before it appends it to the
         # request URL.
-        params["q"] = parsed_image_url.query
+        params["q"] = query
 
-    if parsed_image_url.scheme == "https":
+    if scheme == "https":
         # Photon defaults to HTTP without this parameter
         # which will cause some providers to fail (if they
         # do not serve over HTTP and do not have a redirect)
@@ -60,20 +200,15 @@ def get(
 
     # Photon excludes the protocol so we need to reconstruct the url + port + path
     # to send as the "path" of the Photon request
-    domain = parsed_image_url.netloc
-    path = parsed_image_url.path
     upstream_url = f"{settings.PHOTON_ENDPOINT}{domain}{path}"
 
     try:
-        headers = {"Accept": accept_header} | HEADERS
-        if settings.PHOTON_AUTH_KEY:
-            headers["X-Photon-Authentication"] = settings.PHOTON_AUTH_KEY
-
-        upstream_response = requests.get(
+        upstream_response = _session.get(
             upstream_url,
             timeout=10,
             params=params,
-            headers=headers,
+            headers=_get_headers(accept_header, settings.PHOTON_AUTH_KEY),
+            stream=True,
         )
         res_status = upstream_response.status_code
         content_type = upstream_response.headers.get("Content-Type")
@@ -82,19 +217,14 @@ def get(
             f"status: {res_status}, content-type: {content_type}"
         )
 
-        return HttpResponse(
-            upstream_response.content,
+        return StreamingHttpResponse(
+            _stream_content(upstream_response, domain),
             status=res_status,
             content_type=content_type,
         )
     except requests.ReadTimeout as exc:
         # Count the incident so that we can identify providers with most timeouts.
-        key = f"{settings.THUMBNAIL_TIMEOUT_PREFIX}{domain}"
-        cache = django_redis.get_redis_connection("default")
-        try:
-            cache.incr(key)
-        except ValueError:  # Key does not exist.
-            cache.set(key, 1)
+        _count_timeout(domain)
 
         sentry_sdk.capture_exception(exc)
         raise UpstreamThumbnailException(
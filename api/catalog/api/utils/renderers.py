@@ -0,0 +1,32 @@
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+import orjson
+
+
+_encoder = JSONEncoder()
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+"""
+Stringify non-``str`` keys like ``json`` does, and leave datetimes to DRF's encoder
+which formats UTC as ``Z`` and truncates to milliseconds.
+"""
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Render JSON with ``orjson``, which is several times faster than ``json``.
+
+    Types that ``orjson`` does not handle are passed to DRF's ``JSONEncoder``, so
+    the output matches that of ``JSONRenderer``. Indented output, as requested by
+    the browsable API, is still rendered by ``JSONRenderer``.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        return orjson.dumps(data, default=_encoder.default, option=_OPTIONS)
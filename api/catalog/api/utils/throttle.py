@@ -11,6 +11,43 @@ from catalog.api.utils.oauth2_helper import get_token_info
 parent_logger = logging.getLogger(__name__)
 
 
+def _get_token_info(request):
+    """
+    Get the information about the access token of the request.
+
+    Every throttle class needs this information so it is looked up at most once per
+    request and stored on the request.
+
+    :param request: the request being throttled
+    :return: the client ID, rate limit model and verification status of the token
+    """
+
+    if not hasattr(request, "_token_info"):
+        if request.auth:
+            request._token_info = get_token_info(str(request.auth))
+        else:
+            request._token_info = (None, None, None)
+    return request._token_info
+
+
+def _is_ip_whitelisted(request, ident: str) -> bool:
+    """
+    Check whether the IP address of the request is exempt from rate limiting.
+
+    Every anonymous throttle class performs this check so Redis is queried at most
+    once per request and the result is stored on the request.
+
+    :param request: the request being throttled
+    :param ident: the identity, i.e. the IP address, of the request
+    :return: whether the IP address is in the whitelist
+    """
+
+    if not hasattr(request, "_ip_whitelisted"):
+        redis = get_redis_connection("default", write=False)
+        request._ip_whitelisted = bool(redis.sismember("ip-whitelist", ident))
+    return request._ip_whitelisted
+
+
 class AbstractAnonRateThrottle(SimpleRateThrottle, metaclass=abc.ABCMeta):
     """
     Limits the rate of API calls that may be made by a anonymous users.
@@ -23,14 +60,12 @@ class AbstractAnonRateThrottle(SimpleRateThrottle, metaclass=abc.ABCMeta):
     def get_cache_key(self, request, view):
         logger = self.logger.getChild("get_cache_key")
         # Do not apply anonymous throttle to request with valid tokens.
-        if request.auth:
-            client_id, _, verified = get_token_info(str(request.auth))
-            if client_id and verified:
-                return None
+        client_id, _, verified = _get_token_info(request)
+        if client_id and verified:
+            return None
 
         ident = self.get_ident(request)
-        redis = get_redis_connection("default", write=False)
-        if redis.sismember("ip-whitelist", ident):
+        if _is_ip_whitelisted(request, ident):
             logger.info(f"bypassing rate limiting for ident={ident}")
             """
             Exempt internal IP addresses. Exists as a legacy holdover and usages of this
@@ -83,8 +118,7 @@ class AbstractOAuth2IdRateThrottle(SimpleRateThrottle, metaclass=abc.ABCMeta):
 
     def get_cache_key(self, request, view):
         # Find the client ID associated with the access token.
-        auth = str(request.auth)
-        client_id, rate_limit_model, verified = get_token_info(auth)
+        client_id, rate_limit_model, verified = _get_token_info(request)
         if client_id and rate_limit_model == self.applies_to_rate_limit_model:
             ident = client_id
         else:
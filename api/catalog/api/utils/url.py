@@ -1,4 +1,8 @@
-from urllib.parse import urlparse
+import re
+
+
+SCHEME_PATTERN = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*:")
+"""matches the scheme of a URL, as detected by ``urllib.parse.urlparse``"""
 
 
 def add_protocol(url: str) -> str:
@@ -13,8 +17,7 @@ def add_protocol(url: str) -> str:
     :return: the URL with the existing scheme, or ``https`` if one did not exist
     """
 
-    parsed = urlparse(url)
-    if parsed.scheme == "":
-        return f"https://{url}"
-    else:
+    if url is None or SCHEME_PATTERN.match(url):
         return url
+    else:
+        return f"https://{url}"
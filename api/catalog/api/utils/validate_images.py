@@ -1,12 +1,16 @@
 import asyncio
+import atexit
+import concurrent.futures
 import logging
+import threading
 import time
+from collections import defaultdict, deque
+from urllib.parse import urlsplit
 
 from django.conf import settings
 
 import aiohttp
 import django_redis
-from asgiref.sync import async_to_sync
 from decouple import config
 from elasticsearch_dsl.response import Hit
 
@@ -17,10 +21,24 @@ parent_logger = logging.getLogger(__name__)
 
 
 CACHE_PREFIX = "valid:"
+HEAD_REQUESTS_TIMEOUT = 2.5
+"""Seconds to wait for all HEAD requests, after which pending URLs count as -1."""
 HEADERS = {
     "User-Agent": settings.OUTBOUND_USER_AGENT_TEMPLATE.format(purpose="LinkValidation")
 }
 
+HEAD_TIMEOUT = 2.0
+"""The longest time, in seconds, that a single HEAD request may take."""
+MIN_HEAD_TIMEOUT = 0.5
+"""The shortest time, in seconds, that a single HEAD request is given."""
+HOST_LATENCY_WINDOW = 100
+"""The number of recent response times per host used to compute its timeout."""
+
+_host_latencies: defaultdict[str, deque[float]] = defaultdict(
+    lambda: deque(maxlen=HOST_LATENCY_WINDOW)
+)
+"""Recent HEAD response times per host; only touched from the background loop."""
+
 
 def _get_cached_statuses(redis, image_urls):
     cached_statuses = redis.mget([CACHE_PREFIX + url for url in image_urls])
@@ -31,25 +49,130 @@ def _get_expiry(status, default):
     return config(f"LINK_VALIDATION_CACHE_EXPIRY__{status}", default=default, cast=int)
 
 
-async def _head(url: str, session: aiohttp.ClientSession) -> tuple[str, int]:
+def _get_head_timeout(host: str) -> float:
+    """
+    Get the timeout for a HEAD request to the given host.
+
+    Hosts are given twice their recent 95th percentile response time, within
+    ``MIN_HEAD_TIMEOUT`` and ``HEAD_TIMEOUT``, so that slow providers fail fast
+    without holding up the rest of the batch. Hosts with too few recent requests
+    are given the full ``HEAD_TIMEOUT``. Only a timeout at the full limit marks a
+    link as dead; see ``_head``.
+
+    :param host: the host of the URL to validate
+    :return: the timeout in seconds
+    """
+
+    latencies = _host_latencies.get(host)
+    if not latencies or len(latencies) < 20:
+        return HEAD_TIMEOUT
+    p95 = sorted(latencies)[int(0.95 * (len(latencies) - 1))]
+    return min(HEAD_TIMEOUT, max(MIN_HEAD_TIMEOUT, p95 * 2))
+
+
+async def _head(url: str, session: aiohttp.ClientSession) -> tuple[str, int | None]:
+    """
+    Make a HEAD request to the URL and get its status.
+
+    :return: the URL and its status, -1 if it failed, or ``None`` if it timed out
+        before the full ``HEAD_TIMEOUT`` and so is inconclusive
+    """
+
+    host = urlsplit(url).netloc
+    timeout = _get_head_timeout(host)
+    start = time.monotonic()
     try:
-        async with session.head(url, allow_redirects=False) as response:
+        async with session.head(
+            url, allow_redirects=False, timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
+            _host_latencies[host].append(time.monotonic() - start)
             return url, response.status
-    except (aiohttp.ClientError, asyncio.TimeoutError) as exception:
+    except asyncio.TimeoutError as exception:
+        # Record the timeout so that the host's next timeouts stay generous.
+        _host_latencies[host].append(timeout)
+        _log_validation_failure(exception)
+        # A shorter, adaptive timeout only shows that the host was slower than it
+        # usually is, not that the image is gone.
+        return url, -1 if timeout >= HEAD_TIMEOUT else None
+    except aiohttp.ClientError as exception:
         _log_validation_failure(exception)
         return url, -1
 
 
-# https://stackoverflow.com/q/55259755
-@async_to_sync
-async def _make_head_requests(urls: list[str]) -> list[tuple[str, int]]:
-    tasks = []
-    timeout = aiohttp.ClientTimeout(total=2)
-    async with aiohttp.ClientSession(headers=HEADERS, timeout=timeout) as session:
-        tasks = [asyncio.ensure_future(_head(url, session)) for url in urls]
-        responses = asyncio.gather(*tasks)
-        await responses
-    return responses.result()
+_loop: asyncio.AbstractEventLoop | None = None
+"""The event loop, running in a daemon thread, on which HEAD requests are made."""
+
+_loop_lock = threading.Lock()
+
+_session: aiohttp.ClientSession | None = None
+"""The session shared by all validations to reuse connections and DNS lookups."""
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the background event loop, starting it on first use.
+
+    The loop is started lazily rather than at import so that each forked worker
+    process gets its own thread.
+
+    :return: the running background event loop
+    """
+
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever, name="validate-images", daemon=True
+            ).start()
+            atexit.register(_close_session)
+    return _loop
+
+
+def _close_session():
+    if _session is not None:
+        asyncio.run_coroutine_threadsafe(_session.close(), _loop).result(timeout=1)
+
+
+def _get_session() -> aiohttp.ClientSession:
+    # Only ever called from within the background event loop, hence no lock.
+    global _session
+    if _session is None:
+        _session = aiohttp.ClientSession(
+            headers=HEADERS,
+            timeout=aiohttp.ClientTimeout(total=HEAD_TIMEOUT),
+            connector=aiohttp.TCPConnector(
+                limit=200, limit_per_host=20, ttl_dns_cache=300, keepalive_timeout=60
+            ),
+        )
+    return _session
+
+
+async def _gather_heads(urls: list[str]) -> list[tuple[str, int | None]]:
+    session = _get_session()
+    statuses = dict.fromkeys(urls, -1)
+    tasks = [asyncio.ensure_future(_head(url, session)) for url in urls]
+    try:
+        # Collect responses as they arrive so that one slow provider only loses
+        # its own statuses when the deadline passes.
+        for next_done in asyncio.as_completed(tasks, timeout=HEAD_REQUESTS_TIMEOUT):
+            url, status = await next_done
+            statuses[url] = status
+    except asyncio.TimeoutError as exception:
+        for task in tasks:
+            task.cancel()
+        _log_validation_failure(exception)
+    return list(statuses.items())
+
+
+def _make_head_requests(urls: list[str]) -> list[tuple[str, int | None]]:
+    future = asyncio.run_coroutine_threadsafe(_gather_heads(urls), _get_loop())
+    try:
+        return future.result(timeout=3)
+    except concurrent.futures.TimeoutError as exception:
+        future.cancel()
+        _log_validation_failure(exception)
+        return [(url, -1) for url in urls]
 
 
 def validate_images(
@@ -84,16 +207,16 @@ def validate_images(
             to_verify[url] = idx
     logger.debug(f"len(to_verify)={len(to_verify)}")
 
-    verified = _make_head_requests(to_verify.keys())
-
-    # Cache newly verified image statuses.
-    to_cache = {CACHE_PREFIX + url: status for url, status in verified}
+    verified = _make_head_requests(list(to_verify))
 
+    # Cache newly verified image statuses, setting the value and TTL atomically.
     pipe = redis.pipeline()
-    if len(to_cache) > 0:
-        pipe.mset(to_cache)
-
-    for key, status in to_cache.items():
+    for url, status in verified:
+        key = CACHE_PREFIX + url
+        if status is None:
+            # Inconclusive, so left for the next search to validate again
+            logger.debug(f"inconclusive timeout key={key}")
+            continue
         if status == 200:
             logger.debug(f"healthy link key={key}")
         elif status == -1:
@@ -103,23 +226,25 @@ def validate_images(
 
         expiry = settings.LINK_VALIDATION_CACHE_EXPIRY_CONFIGURATION[status]
         logger.debug(f"caching status={status} expiry={expiry}")
-        pipe.expire(key, expiry)
-
-    pipe.execute()
+        pipe.set(key, status, ex=expiry)
 
     # Merge newly verified results with cached statuses
     for idx, url in enumerate(to_verify):
         cache_idx = to_verify[url]
         cached_statuses[cache_idx] = verified[idx][1]
 
-    # Create a new dead link mask
-    new_mask = [1] * len(results)
-
-    # Delete broken images from the search results response.
-    for idx, _ in enumerate(cached_statuses):
-        del_idx = len(cached_statuses) - idx - 1
-        status = cached_statuses[del_idx]
-        if status == 429 or status == 403:
+    # Classify each result in a single pass, building the new dead link mask and the
+    # list of live results together.
+    new_mask = []
+    live_results = []
+    for idx, status in enumerate(cached_statuses):
+        if status is None:
+            # Timed out before the full timeout, which is inconclusive, so keep these.
+            logger.info(
+                "Image validation timed out early, keeping " f"url={image_urls[idx]} "
+            )
+        elif status == 429 or status == 403:
+            # Rate limited or blocked validations are inconclusive, so keep these.
             logger.warning(
                 "Image validation failed due to rate limiting or blocking. "
                 f"url={image_urls[idx]} "
@@ -128,13 +253,16 @@ def validate_images(
         elif status != 200:
             logger.info(
                 "Deleting broken image from results "
-                f"id={results[del_idx]['identifier']} "
+                f"id={results[idx]['identifier']} "
                 f"status={status} "
             )
-            # remove the result, mutating in place
-            del results[del_idx]
-            # update the result's position in the mask to indicate it is dead
-            new_mask[del_idx] = 0
+            new_mask.append(0)
+            continue
+        new_mask.append(1)
+        live_results.append(results[idx])
+
+    # Delete broken images from the search results response, mutating in place.
+    results[:] = live_results
 
     # Merge and cache the new mask
     mask = get_query_mask(query_hash)
@@ -143,7 +271,9 @@ def validate_images(
         # the results we've verified this time around. Overwrite everything after
         # with our new results validation mask.
         new_mask = mask[:start_slice] + new_mask
-    save_query_mask(query_hash, new_mask)
+    # Send the mask along with the newly verified statuses in one round-trip.
+    save_query_mask(query_hash, new_mask, pipe)
+    pipe.execute()
 
     end_time = time.time()
     logger.debug(
@@ -1,15 +1,15 @@
 import logging
 import os
-import struct
-from enum import Flag, auto
+from functools import lru_cache
 from io import BytesIO
-from textwrap import wrap
 
 from django.conf import settings
+from rest_framework import status
+from rest_framework.exceptions import APIException
 
-import piexif
 import requests
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw, ImageFont, ImageOps, UnidentifiedImageError
+from requests.adapters import HTTPAdapter
 from sentry_sdk import capture_exception
 
 
@@ -26,14 +26,40 @@ HEADERS = {
     "User-Agent": settings.OUTBOUND_USER_AGENT_TEMPLATE.format(purpose="Watermark")
 }
 
+# Content types that can never be decoded as images. Anything else, notably
+# ``application/octet-stream`` which many providers serve images as, is left to Pillow.
+NON_IMAGE_CONTENT_TYPES = frozenset(
+    {
+        "application/javascript",
+        "application/json",
+        "application/pdf",
+        "application/xhtml+xml",
+        "application/xml",
+    }
+)
+NON_IMAGE_MAIN_TYPES = frozenset({"audio", "text", "video"})
 
-class Dimension(Flag):
-    """This enum represents the two dimensions of an image."""
 
-    HEIGHT = auto()
-    WIDTH = auto()
-    BOTH = HEIGHT | WIDTH
-    NONE = 0
+class UpstreamWatermarkException(APIException):
+    status_code = status.HTTP_424_FAILED_DEPENDENCY
+    default_detail = "Could not watermark image due to upstream provider error."
+    default_code = "upstream_watermark_failure"
+
+
+_session = requests.Session()
+"""Images are often watermarked in quick succession so keep the connections alive."""
+_session.headers.update(HEADERS)
+_session.mount("https://", HTTPAdapter(pool_maxsize=32))
+
+
+_MEASURING_DRAW = ImageDraw.Draw(Image.new("1", (0, 0)))
+"""Used to measure text, which does not depend on the image drawn on."""
+
+
+# Bits of the mask of the dimensions of an image; plain integers are much cheaper
+# to combine and test than ``enum.Flag`` members.
+HEIGHT = 1
+WIDTH = 2
 
 
 # Utils
@@ -45,15 +71,12 @@ def _smaller_dimension(width, height):
 
     :param width: the width of the image
     :param height: the height of the image
-    :return: True if the image is small, False otherwise
+    :return: the mask of ``WIDTH`` and ``HEIGHT`` for the small dimensions, 0 if none
     """
 
-    smaller_dimension = Dimension.NONE
-    if width < BREAKPOINT_DIMENSION:
-        smaller_dimension = smaller_dimension | Dimension.WIDTH
-    if height < BREAKPOINT_DIMENSION:
-        smaller_dimension = smaller_dimension | Dimension.HEIGHT
-    return smaller_dimension
+    small_width = width < BREAKPOINT_DIMENSION
+    small_height = height < BREAKPOINT_DIMENSION
+    return small_width * WIDTH | small_height * HEIGHT
 
 
 def _get_font_path(monospace=False):
@@ -70,51 +93,60 @@ def _get_font_path(monospace=False):
     return font_path
 
 
-def _fit_in_width(text, font, max_width):
-    """
-    Break the given text so that it fits in the given space.
-
-    :param text: the text to fit in the limited width
-    :param font: the font containing size and other info
-    :param max_width: the maximum width the text is allowed to take
-    :return: the fitted text
+@lru_cache(maxsize=256)
+def _get_font(size, monospace=False):
     """
+    Load the TTF font at the given size.
 
-    char_width, _ = font.getsize("x")  # x has the closest to average width
-    max_chars = max_width // char_width
+    Loading a font parses the TTF file, so fonts are cached; sizes are derived from
+    the image dimensions and take few distinct values.
 
-    text = "\n".join(["\n".join(wrap(line, max_chars)) for line in text.split("\n")])
-
-    return text
-
-
-# Framing
-
-
-def _create_frame(dimensions):
-    """
-    Create a frame with the given dimensions.
-
-    :param dimensions: a tuple containing the width and height of the frame
-    :return: a white frame with the given dimensions
+    :param size: the size of the font
+    :param monospace: True for monospaced font, False for variable-width font
+    :return: the font object
     """
 
-    return Image.new("RGB", dimensions, FRAME_COLOR)
+    return ImageFont.truetype(_get_font_path(monospace), size=size)
 
 
-def _frame_image(image, frame, left_margin, top_margin):
+def _fit_in_width(text, font, max_width):
     """
-    Fix the image in the frame with the specified spacing.
+    Break the given text so that it fits in the given space.
 
-    :param image: the image to frame
-    :param frame: the frame in which to fit the image
-    :param left_margin: the margin to the left of the image
-    :param top_margin: the margin to the top of the image
-    :return: the framed image
+    Words are measured with the font itself, so that the variable-width font wraps
+    as tightly as possible. Words wider than the space are broken across lines.
+
+    :param text: the text to fit in the limited width
+    :param font: the font containing size and other info
+    :param max_width: the maximum width the text is allowed to take
+    :return: the fitted text
     """
 
-    frame.paste(image, (left_margin, top_margin))
-    return frame
+    space_width = font.getlength(" ")
+    lines = []
+    for paragraph in text.split("\n"):
+        line, line_width = [], 0
+        for word in paragraph.split():
+            word_width = font.getlength(word)
+            while word_width > max_width and len(word) > 1:
+                # Break the word after the longest prefix that fits on a line.
+                cut = len(word) - 1
+                while cut > 1 and font.getlength(word[:cut]) > max_width:
+                    cut -= 1
+                if line:
+                    lines.append(" ".join(line))
+                    line, line_width = [], 0
+                lines.append(word[:cut])
+                word = word[cut:]
+                word_width = font.getlength(word)
+            if line and line_width + space_width + word_width > max_width:
+                lines.append(" ".join(line))
+                line, line_width = [], 0
+            line_width += (space_width if line else 0) + word_width
+            line.append(word)
+        lines.append(" ".join(line))
+
+    return "\n".join(lines)
 
 
 # Attribution
@@ -150,6 +182,49 @@ def _get_attribution_text(image_info):
     return f'"{title}" by {creator} is licensed under {full_license}.'
 
 
+@lru_cache(maxsize=1024)
+def _layout_attribution(text, font_size, max_width):
+    """
+    Wrap the attribution text and measure the height of the wrapped text.
+
+    Popular images are watermarked repeatedly with the same text and size, so the
+    layout is cached to skip shaping the text with FreeType each time.
+
+    :param text: the attribution text
+    :param font_size: the size of the font used to render the text
+    :param max_width: the maximum width in pixels of a line of text
+    :return: the wrapped text and its height in pixels
+    """
+
+    font = _get_font(font_size)
+    text = _fit_in_width(text, font, max_width)
+    # The text is drawn from the top left, so its height is the bottom of its box.
+    *_, attribution_height = _MEASURING_DRAW.multiline_textbbox((0, 0), text, font=font)
+
+    return text, attribution_height
+
+
+@lru_cache(maxsize=128)
+def _get_attribution_stamp(text, font_size):
+    """
+    Render the wrapped attribution text into a mask that can be pasted in colour.
+
+    The stamp is cached alongside the layout so that watermarking a popular image
+    again skips rendering the glyphs entirely.
+
+    :param text: the wrapped attribution text
+    :param font_size: the size of the font used to render the text
+    :return: the grayscale mask of the rendered text
+    """
+
+    font = _get_font(font_size)
+    _, _, right, bottom = _MEASURING_DRAW.multiline_textbbox((0, 0), text, font=font)
+    stamp = Image.new("L", (max(right, 1), max(bottom, 1)))
+    ImageDraw.Draw(stamp).multiline_text((0, 0), text, font=font, fill=255)
+
+    return stamp
+
+
 # Actions
 
 
@@ -158,24 +233,46 @@ def _open_image(url):
     Read an image from a URL and convert it into a PIL Image object.
 
     :param url: the URL from where to read the image
-    :return: the PIL image object with the EXIF data
+    :return: the PIL image object and its raw EXIF bytes
+    :raises UpstreamWatermarkException: if the image cannot be loaded
     """
     logger = parent_logger.getChild("_open_image")
+    max_bytes = settings.WATERMARK_MAX_BYTES
     try:
-        response = requests.get(url, headers=HEADERS)
-        img_bytes = BytesIO(response.content)
+        img_bytes = BytesIO()
+        with _session.get(url, stream=True, timeout=(3, 10)) as res:
+            # Refuse non-images and oversized images before downloading the body.
+            content_type = res.headers.get("Content-Type", "").partition(";")[0]
+            content_type = content_type.strip().lower()
+            if (
+                content_type in NON_IMAGE_CONTENT_TYPES
+                or content_type.partition("/")[0] in NON_IMAGE_MAIN_TYPES
+            ):
+                logger.error(f"Unsupported content type: {content_type}")
+                raise UpstreamWatermarkException(
+                    f"Upstream content type {content_type} is not an image."
+                )
+            if int(res.headers.get("Content-Length") or 0) > max_bytes:
+                logger.error(f"Image is larger than {max_bytes} bytes")
+                raise UpstreamWatermarkException("Upstream image is too large.")
+            for chunk in res.iter_content(chunk_size=64 * 1024):
+                img_bytes.write(chunk)
+                # The ``Content-Length`` header may be missing or wrong.
+                if img_bytes.tell() > max_bytes:
+                    logger.error(f"Image is larger than {max_bytes} bytes")
+                    raise UpstreamWatermarkException("Upstream image is too large.")
+        img_bytes.seek(0)
         img = Image.open(img_bytes)
     except requests.exceptions.RequestException as e:
         capture_exception(e)
         logger.error(f"Error loading image data: {e}")
-        return None, None
+        raise UpstreamWatermarkException(f"Failed to load upstream image: {e}")
+    except UnidentifiedImageError as e:
+        logger.error(f"Error decoding image data: {e}")
+        raise UpstreamWatermarkException("Upstream image could not be decoded.")
 
-    try:
-        # Preserve EXIF metadata
-        exif = piexif.load(img.info["exif"]) if "exif" in img.info else None
-        return img, exif
-    except struct.error:
-        return img, None
+    # Preserve EXIF metadata, as raw bytes that can be passed to ``Image.save``
+    return img, img.info.get("exif")
 
 
 def _print_attribution_on_image(img, image_info):
@@ -190,47 +287,40 @@ def _print_attribution_on_image(img, image_info):
     width, height = img.size
     smaller_dimension = _smaller_dimension(width, height)
 
-    if smaller_dimension is Dimension.NONE:
+    if not smaller_dimension:
         margin = round(MARGIN_RATIO * min(width, height))
         font_size = round(FONT_RATIO * min(width, height))
         new_width = width
     else:
         margin = round(MARGIN_RATIO * BREAKPOINT_DIMENSION)
         font_size = round(FONT_RATIO * BREAKPOINT_DIMENSION)
-        new_width = (
-            BREAKPOINT_DIMENSION if Dimension.WIDTH in smaller_dimension else width
-        )
-
-    font = ImageFont.truetype(_get_font_path(), size=font_size)
+        new_width = BREAKPOINT_DIMENSION if smaller_dimension & WIDTH else width
 
-    text = _get_attribution_text(image_info)
-    text = _fit_in_width(text, font, new_width)
-    _, attribution_height = font.getsize_multiline(text)
+    text, attribution_height = _layout_attribution(
+        _get_attribution_text(image_info), font_size, new_width
+    )
 
     frame_width = margin + new_width + margin
     frame_height = margin + height + margin + attribution_height + margin
     left_margin = (frame_width - width) // 2
 
-    frame = _create_frame(
-        (
-            frame_width,
-            frame_height,
-        )
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    frame = ImageOps.expand(
+        img,
+        border=(
+            left_margin,
+            margin,
+            frame_width - width - left_margin,
+            frame_height - height - margin,
+        ),
+        fill=FRAME_COLOR,
     )
-    _frame_image(img, frame, left_margin, margin)
 
-    draw = ImageDraw.Draw(frame)
+    stamp = _get_attribution_stamp(text, font_size)
     text_position_x = margin
     text_position_y = margin + height + margin
-    draw.text(
-        xy=(
-            text_position_x,
-            text_position_y,
-        ),
-        text=text,
-        font=font,
-        fill=TEXT_COLOR,
-    )
+    frame.paste(TEXT_COLOR, (text_position_x, text_position_y), stamp)
 
     return frame
 
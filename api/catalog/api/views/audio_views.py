@@ -78,7 +78,8 @@ class AudioViewSet(MediaViewSet):
         audio = self.get_object()
 
         try:
-            obj = {"points": audio.get_or_create_waveform()}
+            points = audio.get_or_create_waveform()
+            obj = {"len": len(points), "points": points}
             serializer = self.get_serializer(obj)
 
             return Response(status=200, data=serializer.data)
@@ -1,3 +1,6 @@
+import threading
+import time
+
 from django.conf import settings
 from django.db import connection
 from rest_framework import status
@@ -7,6 +10,34 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 
+ES_HEALTH_CACHE_TTL = 2  # seconds
+"""How long a cluster health response is reused before querying ES again."""
+
+_es_health_lock = threading.Lock()
+_es_health_cache: tuple[float, dict] | None = None
+
+
+def _get_es_health() -> dict:
+    """
+    Get the Elasticsearch cluster health, reusing a recent response if any.
+
+    Load balancers hit the healthcheck constantly, so the response is cached per
+    process to bound the load on ES and to avoid tying up every worker when the
+    cluster stalls.
+    """
+
+    global _es_health_cache
+
+    with _es_health_lock:
+        now = time.monotonic()
+        if _es_health_cache and now - _es_health_cache[0] < ES_HEALTH_CACHE_TTL:
+            return _es_health_cache[1]
+
+        es_health = settings.ES.cluster.health(timeout="5s")
+        _es_health_cache = (now, es_health)
+        return es_health
+
+
 class ElasticsearchHealthcheckException(APIException):
     status_code = status.HTTP_503_SERVICE_UNAVAILABLE
 
@@ -38,7 +69,7 @@ class HealthCheck(APIView):
 
         Raises an exception if ES is not healthy.
         """
-        es_health = settings.ES.cluster.health(timeout="5s")
+        es_health = _get_es_health()
 
         if es_health["timed_out"]:
             raise ElasticsearchHealthcheckException("es_timed_out")
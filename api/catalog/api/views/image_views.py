@@ -1,6 +1,5 @@
 import io
 import re
-import struct
 
 from django.conf import settings
 from django.http.response import FileResponse, HttpResponse
@@ -10,7 +9,6 @@ from rest_framework.decorators import action
 from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
 
-import piexif
 import requests
 from drf_yasg.utils import swagger_auto_schema
 from PIL import Image as PILImage
@@ -137,21 +135,17 @@ class ImageViewSet(MediaViewSet):
         }
 
         # Create the actual watermarked image.
-        watermarked, exif = watermark(image_url, image_info, params.data["watermark"])
-        # Re-insert EXIF metadata.
-        if exif:
-            # piexif dump raises InvalidImageDataError which is a child class
-            # of ValueError, and a struct error when the value is not
-            # between -2147483648 and 2147483647
-            # https://github.com/WordPress/openverse-api/issues/849
-            try:
-                exif_bytes = piexif.dump(exif)
-            except (struct.error, ValueError):
-                exif_bytes = None
+        watermarked, exif_bytes = watermark(
+            image_url, image_info, params.data["watermark"]
+        )
+        if not params.data["watermark"] and watermarked.format == "JPEG":
+            # Without a frame the image is unchanged, so send the original JPEG,
+            # which already contains its EXIF metadata, without decoding it.
+            watermarked.fp.seek(0)
+            img_bytes = io.BytesIO(watermarked.fp.read())
         else:
-            exif_bytes = None
-        img_bytes = io.BytesIO()
-        self._save_wrapper(watermarked, exif_bytes, img_bytes)
+            img_bytes = io.BytesIO()
+            self._save_wrapper(watermarked, exif_bytes, img_bytes)
 
         if params.data["embed_metadata"]:
             # Embed ccREL metadata with XMP.
@@ -173,13 +167,9 @@ class ImageViewSet(MediaViewSet):
                 return FileResponse(with_xmp, content_type="image/jpeg")
             except (libxmp.XMPError, AttributeError):
                 # Just send the EXIF-ified file if libxmp fails to add metadata
-                response = HttpResponse(content_type="image/jpeg")
-                self._save_wrapper(watermarked, exif_bytes, response)
-                return response
-        else:
-            response = HttpResponse(img_bytes, content_type="image/jpeg")
-            self._save_wrapper(watermarked, exif_bytes, response)
-            return response
+                pass
+
+        return HttpResponse(img_bytes.getvalue(), content_type="image/jpeg")
 
     @action(
         detail=True,
@@ -104,8 +104,7 @@ class MediaViewSet(ReadOnlyModelViewSet):
         except ValueError as e:
             raise APIException(getattr(e, "message", str(e)))
 
-        serializer_class = self.get_serializer()
-        if params.needs_db or serializer_class.needs_db:
+        if params.needs_db or self.get_serializer().needs_db:
             results = self.get_db_results(results)
 
         serializer = self.get_serializer(results, many=True)
@@ -145,6 +144,11 @@ class MediaViewSet(ReadOnlyModelViewSet):
         except IndexError:
             raise APIException("Could not find items.", 404)
 
+        # Fetch the rows for all hits in one query, with the relations selected in
+        # ``get_queryset``, rather than letting the serializer query per hit.
+        if self.get_serializer().needs_db:
+            results = self.get_db_results(results)
+
         serializer = self.get_serializer(results, many=True)
         return self.get_paginated_response(serializer.data)
 
@@ -24,7 +24,10 @@ from catalog.api.serializers.oauth2_serializers import (
     OAuth2RegistrationSerializer,
     OAuth2RegistrationSuccessful,
 )
-from catalog.api.utils.oauth2_helper import get_token_info
+from catalog.api.utils.oauth2_helper import (
+    get_token_info,
+    invalidate_application_token_info,
+)
 from catalog.api.utils.throttle import OnePerSecond, TenPerDay
 from catalog.custom_auto_schema import CustomAutoSchema
 from catalog.example_responses import (
@@ -186,6 +189,8 @@ class VerifyEmail(APIView):
             verification = OAuth2Verification.objects.get(code=code)
             application_pk = verification.associated_application.pk
             ThrottledApplication.objects.filter(pk=application_pk).update(verified=True)
+            # ``update`` does not send ``post_save`` so invalidate explicitly.
+            invalidate_application_token_info(application_pk)
             verification.delete()
             return Response(
                 status=200,
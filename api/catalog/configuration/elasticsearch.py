@@ -37,9 +37,11 @@ def _elasticsearch_connect():
         max_retries=1,
         retry_on_timeout=True,
         http_auth=auth,
-        wait_for_status="yellow",
     )
-    _es.info()
+    # The client connects lazily on the first request, and the healthcheck
+    # exercises the connection, so startup does not need to wait on ES.
+    if config("ES_VALIDATE_ON_STARTUP", default=False, cast=bool):
+        _es.cluster.health(wait_for_status="yellow")
     return _es
 
 
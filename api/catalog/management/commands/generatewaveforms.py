@@ -1,5 +1,9 @@
 import logging
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from django.db import DEFAULT_DB_ALIAS, connection, connections
+from django.db.models import Exists, OuterRef
 
 from django_tqdm import BaseCommand
 from limit import limit
@@ -7,23 +11,52 @@ from limit import limit
 from catalog.api.models.audio import Audio, AudioAddOn
 
 
-def paginate_reducing_query(get_query_set, page_size=10):
+PAGE_SIZE = 100
+"""The number of audio records loaded at once, unless there are more workers."""
+
+ESTIMATED_COUNT_THRESHOLD = 100_000
+"""Tables with fewer rows than this, according to the planner, are counted exactly."""
+
+
+def estimate_count(model):
+    """
+    Estimate the number of rows in the model's table from the planner statistics.
+
+    Counting a table with tens of millions of rows takes minutes, which is a lot
+    just to draw a progress bar. The statistics are unavailable (-1) or rough for
+    small tables, which should be counted exactly instead.
+
+    :param model: the model whose rows to count
+    :return: the estimated number of rows, or ``None`` if the table is small
+    """
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+            [model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    if row is None or row[0] < ESTIMATED_COUNT_THRESHOLD:
+        return None
+    return row[0]
+
+
+def paginate_by_id(query_set, page_size=10):
     """
     Iterate over the given query set yielding a specific number of entries each time.
 
-    We can't use `Paginator` because it can't handle the situation
-    where the query result changes each time a page is accessed.
-    Because the `audios` QuerySet result is naturally getting smaller
-    each time we successfully process waveforms, we can just take
-    the first ten for each "page" until the page comes back empty.
-    This should theoretically be faster/less DB latency inducing
-    anyway as we're never going to have huge OFFSET values to
-    access deep pages.
+    Each page starts after the last ``id`` of the previous one, so that every
+    page is a single indexed range scan rather than a deepening OFFSET, and rows
+    that failed to process are not returned again.
     """
-    page = list(get_query_set()[0:page_size])
-    while len(page):
+
+    last_id = 0
+    while True:
+        page = list(query_set.filter(id__gt=last_id).order_by("id")[:page_size])
+        if not page:
+            return
         yield page
-        page = list(get_query_set()[0:page_size])
+        last_id = page[-1].id
 
 
 class Command(BaseCommand):
@@ -44,44 +77,123 @@ class Command(BaseCommand):
         parser.add_argument(
             "--max_records", help="Limit the number of waveforms to create.", type=int
         )
+        parser.add_argument(
+            "--workers",
+            help="Number of audio files to process concurrently.",
+            type=int,
+            default=1,
+        )
 
     def get_audio_handler(self, options):
         if options["no_rate_limit"]:
             return lambda audio: audio.get_or_create_waveform()
 
-        @limit(limit=1, every=2)  # Call once per two seconds maximum
+        # Call once per two seconds maximum, per worker
+        @limit(limit=options["workers"], every=2)
         def limited(audio):
             audio.get_or_create_waveform()
 
         return limited
 
-    def _process_wavelengths(self, audios, audio_handler, count_to_process):
-        errored_identifiers = []
+    @staticmethod
+    def _process_audio(audio, audio_handler):
+        """
+        Generate the waveform of one audio file.
+
+        :param audio: the audio for which to generate the waveform
+        :param audio_handler: the function that generates the waveform
+        :return: the exception raised while processing the audio, if any
+        """
+
+        try:
+            audio_handler(audio)
+        except BaseException as err:
+            return err
+        return None
+
+    @staticmethod
+    def _create_executor(workers):
+        """
+        Create a thread pool for processing audio concurrently.
+
+        Each worker thread opens its own database connection, which it keeps for
+        all the audio it processes. The connections are shared with the calling
+        thread so that they can be closed once the pool has shut down.
+
+        :param workers: the number of worker threads
+        :return: the executor and the list of the workers' database connections
+        """
+
+        worker_connections = []
+
+        def share_connection():
+            worker_connection = connections[DEFAULT_DB_ALIAS]
+            worker_connection.inc_thread_sharing()
+            worker_connections.append(worker_connection)
+
+        executor = ThreadPoolExecutor(max_workers=workers, initializer=share_connection)
+        return executor, worker_connections
+
+    def _process_page(self, page, audio_handler, executor):
+        """
+        Process the page of audio, concurrently if an executor is given.
+
+        :return: an iterator of each audio and its error, in order of completion
+        """
+
+        if executor is None:
+            for audio in page:
+                yield audio, self._process_audio(audio, audio_handler)
+            return
+
+        futures = {
+            executor.submit(self._process_audio, audio, audio_handler): audio
+            for audio in page
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+    def _process_wavelengths(
+        self, audios, audio_handler, count_to_process, max_records, workers
+    ):
+        errored_identifiers = set()
         processed = 0
+        executor, worker_connections = (
+            self._create_executor(workers) if workers > 1 else (None, [])
+        )
         with self.tqdm(total=count_to_process) as progress:
-            paginator = paginate_reducing_query(
-                get_query_set=lambda: audios.exclude(identifier__in=errored_identifiers)
-            )
-            for page in paginator:
-                for audio in page:
-                    if processed > count_to_process:
-                        return errored_identifiers
-                    try:
-                        processed += 1
-                        audio_handler(audio)
-                    except subprocess.CalledProcessError as err:
-                        errored_identifiers.append(audio.identifier)
-                        self.error(
-                            f"Unable to process {audio.identifier}: "
-                            f"{err.stderr.decode().strip()}"
-                        )
-                    except KeyboardInterrupt:
-                        errored_identifiers.append(audio.identifier)
-                        return errored_identifiers
-                    except BaseException as err:
-                        errored_identifiers.append(audio.identifier)
-                        self.error(f"Unable to process {audio.identifier}: " f"{err}")
-                    progress.update(1)
+            paginator = paginate_by_id(audios, page_size=max(PAGE_SIZE, workers))
+            try:
+                for page in paginator:
+                    if max_records is not None:
+                        remaining = max_records - processed
+                        if remaining <= 0:
+                            break
+                        page = page[:remaining]
+                    processed += len(page)
+                    results = self._process_page(page, audio_handler, executor)
+                    for audio, err in results:
+                        if err is None:
+                            progress.update(1)
+                            continue
+
+                        errored_identifiers.add(audio.identifier)
+                        if isinstance(err, KeyboardInterrupt):
+                            return errored_identifiers
+                        if isinstance(err, subprocess.CalledProcessError):
+                            err = err.stderr.decode().strip()
+                        self.error(f"Unable to process {audio.identifier}: {err}")
+                        progress.update(1)
+            except KeyboardInterrupt:
+                # With workers, the interrupt reaches the main thread while it
+                # waits on the page rather than inside an audio handler.
+                return errored_identifiers
+            finally:
+                if executor is not None:
+                    executor.shutdown(cancel_futures=True)
+                for worker_connection in worker_connections:
+                    worker_connection.close()
+                    worker_connection.dec_thread_sharing()
 
         return errored_identifiers
 
@@ -90,15 +202,21 @@ class Command(BaseCommand):
         # information, so they get silenced
         logging.getLogger("catalog.api.utils.waveform").setLevel(logging.WARNING)
 
-        existing_waveform_audio_identifiers_query = AudioAddOn.objects.filter(
-            waveform_peaks__isnull=False
-        ).values_list("audio_identifier", flat=True)
-        audios = Audio.objects.exclude(
-            identifier__in=existing_waveform_audio_identifiers_query
-        ).order_by("id")
+        existing_waveforms = AudioAddOn.objects.filter(waveform_peaks__isnull=False)
+        # Only the fields needed to paginate and generate waveforms are loaded.
+        audios = Audio.objects.only("id", "identifier", "url", "duration").filter(
+            ~Exists(existing_waveforms.filter(audio_identifier=OuterRef("identifier")))
+        )
 
         max_records = options["max_records"]
-        count = audios.count()
+        # Only used for the progress bar, so an estimate is good enough for large
+        # tables. The add on estimate includes add ons without peaks and those of
+        # deleted audio, so the difference may undercount slightly.
+        if (estimate := estimate_count(Audio)) is not None:
+            existing = estimate_count(AudioAddOn) or existing_waveforms.count()
+            count = max(estimate - existing, 0)
+        else:
+            count = audios.count()
 
         count_to_process = count
 
@@ -112,14 +230,18 @@ class Command(BaseCommand):
         audio_handler = self.get_audio_handler(options)
 
         errored_identifiers = self._process_wavelengths(
-            audios, audio_handler, count_to_process
+            audios,
+            audio_handler,
+            count_to_process,
+            max_records,
+            options["workers"],
         )
 
         self.info(self.style.SUCCESS("Finished generating waveforms!"))
 
         if errored_identifiers:
             errored_identifiers_joined = "\n".join(
-                str(identifier) for identifier in errored_identifiers
+                str(identifier) for identifier in sorted(errored_identifiers)
             )
 
             self.info(
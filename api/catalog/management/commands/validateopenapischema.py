@@ -1,10 +1,11 @@
+import json
 from argparse import ArgumentParser
+from io import StringIO
 from pathlib import Path
 
 from django.core.management import BaseCommand, call_command
 
 from openapi_spec_validator import validate_spec
-from openapi_spec_validator.readers import read_from_filename
 from openapi_spec_validator.validation import openapi_v2_spec_validator
 
 
@@ -14,8 +15,8 @@ class Command(BaseCommand):
             "--output-dir",
             default=Path(".").absolute(),
             help=(
-                "The direction into which to output the spec file. "
-                "Defaults the the current working directory."
+                "The directory into which to output the spec file if it is "
+                "invalid. Defaults to the current working directory."
             ),
         )
 
@@ -33,10 +34,15 @@ class Command(BaseCommand):
         )
 
     def handle(self, *args, **options):
-        file_path = (Path(options["output_dir"]).absolute() / "openapi.yaml").absolute()
-        call_command("generate_swagger", file_path, overwrite=True)
-        spec_dict, spec_url = read_from_filename(file_path)
-        self.handle_validation(spec_dict)
-        # Only remove the file when there are no errros to ease debugging.
-        # Therefore, we don't `try/except` the call to `handle_validation`
-        file_path.unlink()
+        # Generate the spec in memory, as JSON which is much faster to parse back
+        # than YAML, to avoid writing a file that is only needed for debugging.
+        spec = StringIO()
+        call_command("generate_swagger", "-", format="json", stdout=spec)
+        spec_dict = json.loads(spec.getvalue())
+        try:
+            self.handle_validation(spec_dict)
+        except Exception:
+            # Only write the file when there are errors to ease debugging.
+            file_path = Path(options["output_dir"]).absolute() / "openapi.json"
+            file_path.write_text(spec.getvalue())
+            raise
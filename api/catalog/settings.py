@@ -137,7 +137,7 @@ REST_FRAMEWORK = {
     ),
     "DEFAULT_VERSIONING_CLASS": "rest_framework.versioning.URLPathVersioning",
     "DEFAULT_RENDERER_CLASSES": (
-        "rest_framework.renderers.JSONRenderer",
+        "catalog.api.utils.renderers.ORJSONRenderer",
         "rest_framework.renderers.BrowsableAPIRenderer",
         "rest_framework_xml.renderers.XMLRenderer",
     ),
@@ -315,6 +315,8 @@ OUTBOUND_USER_AGENT_TEMPLATE = config(
 CONTACT_EMAIL = config("CONTACT_EMAIL", default="openverse@wordpress.org")
 
 WATERMARK_ENABLED = config("WATERMARK_ENABLED", default=False, cast=bool)
+# The largest upstream image, in bytes, that will be downloaded for watermarking
+WATERMARK_MAX_BYTES = config("WATERMARK_MAX_BYTES", default=26214400, cast=int)  # 25MiB
 
 EMAIL_SENDER = config("EMAIL_SENDER", default="")
 EMAIL_HOST = config("EMAIL_HOST", default="")
@@ -31,7 +31,9 @@ from django_redis import get_redis_connection
 from catalog.api.utils.validate_images import CACHE_PREFIX
 
 
-@pytest.fixture
+# The fixtures below are module-scoped so that each search is only requested once,
+# with its results kept valid for all the tests of the module that share it.
+@pytest.fixture(scope="module")
 def force_result_validity():
     statuses = {}
 
@@ -50,7 +52,7 @@ def force_result_validity():
         redis.delete(*list(statuses.keys()))
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def audio_fixture(force_result_validity):
     res = requests.get(f"{API_URL}/v1/audio/", verify=False)
     parsed = res.json()
@@ -59,7 +61,7 @@ def audio_fixture(force_result_validity):
     return parsed
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def jamendo_audio_fixture(force_result_validity):
     """
     Get an audio object specifically from the Jamendo provider.
@@ -0,0 +1,9 @@
+from test.utils import SESSION
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def close_session():
+    yield
+    SESSION.close()
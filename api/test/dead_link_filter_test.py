@@ -1,30 +1,36 @@
 from test.constants import API_URL
+from test.utils import SESSION
 from unittest.mock import patch
 from uuid import uuid4
 
 from django.conf import settings
 
 import pytest
-import requests
-from fakeredis import FakeRedis
+from fakeredis import FakeRedis, FakeServer
 
 from catalog.api.controllers.search_controller import DEAD_LINK_RATIO
 
 
-@pytest.fixture(autouse=True)
-def redis(monkeypatch) -> FakeRedis:
-    fake_redis = FakeRedis()
+@pytest.fixture(scope="module")
+def module_redis() -> FakeRedis:
+    # Shared by the tests of the module and emptied after each of them
+    fake_redis = FakeRedis(server=FakeServer())
+    yield fake_redis
+    fake_redis.client().close()
+
 
+@pytest.fixture(autouse=True)
+def redis(monkeypatch, module_redis) -> FakeRedis:
     def get_redis_connection(*args, **kwargs):
-        return fake_redis
+        return module_redis
 
     monkeypatch.setattr(
         "catalog.api.utils.dead_link_mask.get_redis_connection", get_redis_connection
     )
     monkeypatch.setattr("django_redis.get_redis_connection", get_redis_connection)
 
-    yield fake_redis
-    fake_redis.client().close()
+    yield module_redis
+    module_redis.flushdb()
 
 
 @pytest.fixture(autouse=True)
@@ -69,11 +75,7 @@ _MAKE_HEAD_REQUESTS_MODULE_PATH = (
 
 def _patch_make_head_requests():
     def _make_head_requests(urls):
-        responses = []
-        for idx, url in enumerate(urls):
-            status_code = 200 if idx % 10 != 0 else 404
-            responses.append((url, status_code))
-        return responses
+        return [(url, 200 if idx % 10 else 404) for idx, url in enumerate(urls)]
 
     return patch(_MAKE_HEAD_REQUESTS_MODULE_PATH, side_effect=_make_head_requests)
 
@@ -83,12 +85,10 @@ def patch_link_validation_dead_for_count(count):
 
     def _make_head_requests(urls):
         nonlocal total_res_count
-        responses = []
-        for idx, url in enumerate(urls):
-            total_res_count += 1
-            status_code = 404 if total_res_count <= count else 200
-            responses.append((url, status_code))
-        return responses
+        # The first ``count`` URLs across all calls are dead
+        dead = max(count - total_res_count, 0)
+        total_res_count += len(urls)
+        return [(url, 404) for url in urls[:dead]] + [(url, 200) for url in urls[dead:]]
 
     return patch(_MAKE_HEAD_REQUESTS_MODULE_PATH, side_effect=_make_head_requests)
 
@@ -170,7 +170,7 @@ def search_factory(client):
     """Allow passing url parameters along with a search request."""
 
     def _parameterized_search(**kwargs):
-        response = requests.get(f"{API_URL}/v1/images", params=kwargs, verify=False)
+        response = SESSION.get(f"{API_URL}/v1/images", params=kwargs, verify=False)
         assert response.status_code == 200
         parsed = response.json()
         return parsed
@@ -214,22 +214,14 @@ def test_page_consistency_removing_dead_links(search_without_dead_links):
         page_data = search_without_dead_links(q="*", page_size=page_size, page=page)
         page_results += page_data["results"]
 
-    def no_duplicates(xs):
-        s = set()
-        for x in xs:
-            if x in s:
-                return False
-            s.add(x)
-        return True
-
-    ids = list(map(lambda x: x["id"], page_results))
+    ids = [result["id"] for result in page_results]
     # No results should be repeated so we should have no duplicate ids
-    assert no_duplicates(ids)
+    assert len(set(ids)) == len(ids)
 
 
 @pytest.mark.django_db
 def test_max_page_count():
-    response = requests.get(
+    response = SESSION.head(
         f"{API_URL}/v1/images",
         params={"page": settings.MAX_PAGINATION_DEPTH + 1},
         verify=False,
@@ -1,4 +1,4 @@
-from uuid import uuid4
+import itertools
 
 from factory import Faker
 from faker.providers import BaseProvider
@@ -6,11 +6,6 @@ from faker.providers.internet import Provider as InternetProvider
 from faker.utils.distribution import choices_distribution
 
 
-class ChoiceProvider(BaseProvider):
-    def random_choice_field(self, choices):
-        return self.random_element(elements=[choice[0] for choice in choices])
-
-
 class WaveformProvider(BaseProvider):
     _float_space = [x / 100.0 for x in range(101)] * 20
 
@@ -18,15 +13,46 @@ class WaveformProvider(BaseProvider):
     def generate_waveform(cls) -> list[float]:
         return choices_distribution(cls._float_space, p=None, length=1000)
 
+    @classmethod
+    def generate_waveforms(cls, count: int) -> list[list[float]]:
+        """Generate ``count`` waveforms from a single draw of peaks."""
+
+        peaks = choices_distribution(cls._float_space, p=None, length=1000 * count)
+        return [peaks[i : i + 1000] for i in range(0, len(peaks), 1000)]
+
     def waveform(self) -> list[float]:
         return WaveformProvider.generate_waveform()
 
 
+class PooledProvider(BaseProvider):
+    """
+    Reuse a bounded pool of generated values for fields that need not be unique.
+
+    Formatters like ``url`` and ``waveform`` are slow relative to the rest of a
+    factory, so once the pool for a source formatter is full, values are picked
+    from it instead of being generated again. Pooled values are shared, so do not
+    mutate them.
+    """
+
+    pool_size = 256
+    _pools: dict[str, list] = {}
+
+    def pooled(self, source: str):
+        pool = self._pools.setdefault(source, [])
+        if len(pool) < self.pool_size:
+            value = self.generator.format(source)
+            pool.append(value)
+            return value
+        return self.random_element(pool)
+
+
 class GloballyUniqueUrl(InternetProvider):
+    _unique_suffixes = itertools.count()
+
     def globally_unique_url(self) -> str:
-        return f"{self.url()}?{uuid4()}"
+        return f"{self.generator.pooled('url')}?{next(self._unique_suffixes)}"
 
 
-Faker.add_provider(ChoiceProvider)
 Faker.add_provider(WaveformProvider)
+Faker.add_provider(PooledProvider)
 Faker.add_provider(GloballyUniqueUrl)
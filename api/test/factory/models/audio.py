@@ -17,4 +17,4 @@ class AudioAddOnFactory(DjangoModelFactory):
 
     audio_identifier = IdentifierFactory(AudioFactory)
 
-    waveform_peaks = Faker("waveform")
+    waveform_peaks = Faker("pooled", source="waveform")
@@ -11,17 +11,17 @@ from catalog.api.models.oauth import (
 )
 
 
+_CLIENT_TYPES = tuple(choice[0] for choice in ThrottledApplication.CLIENT_TYPES)
+_GRANT_TYPES = tuple(choice[0] for choice in ThrottledApplication.GRANT_TYPES)
+
+
 class ThrottledApplicationFactory(DjangoModelFactory):
     class Meta:
         model = ThrottledApplication
 
     name = Faker("md5")
-    client_type = Faker(
-        "random_choice_field", choices=ThrottledApplication.CLIENT_TYPES
-    )
-    authorization_grant_type = Faker(
-        "random_choice_field", choices=ThrottledApplication.GRANT_TYPES
-    )
+    client_type = Faker("random_element", elements=_CLIENT_TYPES)
+    authorization_grant_type = Faker("random_element", elements=_GRANT_TYPES)
 
 
 class OAuth2RegistrationFactory(DjangoModelFactory):
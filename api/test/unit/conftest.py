@@ -18,7 +18,7 @@ def capture_exception(monkeypatch):
     yield mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def request_factory() -> APIRequestFactory():
     request_factory = APIRequestFactory(defaults={"REMOTE_ADDR": "192.0.2.1"})
 
@@ -5,39 +5,79 @@ from test.factory.models.audio import AudioAddOnFactory, AudioFactory
 from unittest import mock
 
 from django.core.management import call_command
-from django.db import connections
+from django.db import connections, transaction
+from django.db.models import Exists, OuterRef
 from django.test.utils import CaptureQueriesContext
 
 import psycopg2
 import pytest
 
 from catalog.api.models.audio import Audio, AudioAddOn
+from catalog.management.commands.generatewaveforms import estimate_count
+
+
+# The tests that do not check waveform contents share a single mocked waveform
+_SHARED_WAVEFORM = WaveformProvider.generate_waveform()
 
 
 @mock.patch("catalog.api.models.audio.generate_peaks")
-def call_generatewaveforms(mock_generate_peaks: mock.MagicMock) -> tuple[str, str]:
-    mock_generate_peaks.side_effect = lambda _: WaveformProvider.generate_waveform()
+def call_generatewaveforms(
+    mock_generate_peaks: mock.MagicMock, **options
+) -> tuple[str, str]:
+    mock_generate_peaks.return_value = _SHARED_WAVEFORM
     out = StringIO()
     err = StringIO()
-    call_command("generatewaveforms", no_rate_limit=True, stdout=out, stderr=err)
+    call_command(
+        "generatewaveforms", no_rate_limit=True, stdout=out, stderr=err, **options
+    )
 
     return out.getvalue(), err.getvalue()
 
 
-def assert_all_audio_have_waveforms():
-    assert (
-        list(
-            AudioAddOn.objects.filter(waveform_peaks__isnull=False).values_list(
-                "audio_identifier"
+def _bulk_audio(n: int) -> list[Audio]:
+    """
+    Create ``n`` audio records with a single multi-row INSERT.
+
+    ``create_batch`` saves each record separately, which dominates the run time of
+    the tests that need dozens of records.
+    """
+
+    return Audio.objects.bulk_create(AudioFactory.build_batch(n), batch_size=500)
+
+
+def _bulk_addons(audio: list[Audio], **kwargs) -> list[AudioAddOn]:
+    # Pass the identifiers of already saved audio so that the ``IdentifierFactory``
+    # does not create (and save) an audio record for every add on.
+    return AudioAddOn.objects.bulk_create(
+        [
+            AudioAddOnFactory.build(audio_identifier=a.identifier, **kwargs)
+            for a in audio
+        ],
+        batch_size=500,
+    )
+
+
+def _audio_without_waveforms():
+    return Audio.objects.filter(
+        ~Exists(
+            AudioAddOn.objects.filter(
+                audio_identifier=OuterRef("identifier"), waveform_peaks__isnull=False
             )
-        ).sort()
-        == list(Audio.objects.all().values_list("identifier")).sort()
+        )
     )
 
 
+def assert_all_audio_have_waveforms():
+    assert set(
+        AudioAddOn.objects.filter(waveform_peaks__isnull=False).values_list(
+            "audio_identifier", flat=True
+        )
+    ) == set(Audio.objects.values_list("identifier", flat=True))
+
+
 @pytest.mark.django_db
 def test_creates_waveforms_for_audio():
-    AudioFactory.create_batch(153)
+    _bulk_audio(153)
 
     assert AudioAddOn.objects.count() == 0
 
@@ -46,19 +86,35 @@ def test_creates_waveforms_for_audio():
     assert_all_audio_have_waveforms()
 
 
+@pytest.mark.django_db(transaction=True)
+def test_creates_waveforms_for_audio_with_multiple_workers():
+    AudioFactory.create_batch(23)
+
+    call_generatewaveforms(workers=4)
+
+    assert_all_audio_have_waveforms()
+
+
+@pytest.mark.django_db
+def test_processes_at_most_max_records():
+    AudioFactory.create_batch(13)
+
+    call_generatewaveforms(max_records=5)
+
+    assert AudioAddOn.objects.filter(waveform_peaks__isnull=False).count() == 5
+
+
 @pytest.mark.django_db
 def test_does_not_reprocess_existing_waveforms():
-    waveformless_audio = AudioFactory.create_batch(3)
+    audio = _bulk_audio(7)
+    waveformless_audio = audio[:3]
 
-    # AudioAddOnFactory will create associated Audio objects as well
-    # so those three will serve as the audio that should _not_ get processed
-    AudioAddOnFactory.create_batch(3)
+    # These three already have waveforms and should _not_ get processed
+    _bulk_addons(audio[3:6])
 
     # Create an add on that doesn't have a waveform, this one should get processed as well
-    null_waveform_addon = AudioAddOnFactory.create(waveform_peaks=None)
-    waveformless_audio.append(
-        Audio.objects.get(identifier=null_waveform_addon.audio_identifier)
-    )
+    _bulk_addons(audio[6:], waveform_peaks=None)
+    waveformless_audio.append(audio[6])
 
     out, err = call_generatewaveforms()
 
@@ -66,32 +122,47 @@ def test_does_not_reprocess_existing_waveforms():
     assert_all_audio_have_waveforms()
 
 
+@pytest.fixture(scope="session")
+def waveform_queries_per_iteration(django_db_setup, django_db_blocker) -> int:
+    """Count the queries made by ``get_or_create_waveform`` for a single audio."""
+
+    # Measured inside a transaction, like the test that uses it, so that the count
+    # includes the savepoint queries, and rolled back so that nothing is left behind
+    with django_db_blocker.unblock(), transaction.atomic(), mock.patch(
+        "catalog.api.models.audio.generate_peaks"
+    ) as mock_generate_peaks:
+        mock_generate_peaks.return_value = _SHARED_WAVEFORM
+        audio = AudioFactory.create()
+        with CaptureQueriesContext(connections["default"]) as capture:
+            audio.get_or_create_waveform()
+        transaction.set_rollback(True)
+
+    return len(capture.captured_queries)
+
+
 @pytest.mark.django_db
+@mock.patch("catalog.management.commands.generatewaveforms.PAGE_SIZE", 10)
 @mock.patch("catalog.api.models.audio.generate_peaks")
 def test_paginates_audio_waveforms_to_generate(
-    mock_generate_peaks, django_assert_num_queries
+    mock_generate_peaks, django_assert_num_queries, waveform_queries_per_iteration
 ):
-    mock_generate_peaks.return_value = WaveformProvider.generate_waveform()
+    mock_generate_peaks.return_value = _SHARED_WAVEFORM
 
+    # Audio that already has waveforms is excluded by the query, so it does not
+    # add any pages
+    _bulk_addons(_bulk_audio(27))
     audio_count = 53  # 6 pages
     pages = 6
-    AudioFactory.create_batch(audio_count)
-
-    test_audio = AudioFactory.create()
-    with CaptureQueriesContext(connections["default"]) as capture:
-        test_audio.get_or_create_waveform()
-    test_audio.delete()
-
-    queries_per_iteration = len(capture.captured_queries)
+    _bulk_audio(audio_count)
 
     # 1 per page + the final empty page's query
     pagination_queries = pages + 1
 
-    # initializes the count for tqdm
-    count_queries = 1
+    # estimates and initializes the count for tqdm
+    count_queries = 2
 
     # queries inside get_or_create_waveform
-    interation_queries = queries_per_iteration * audio_count
+    interation_queries = waveform_queries_per_iteration * audio_count
 
     expected_queries = interation_queries + pagination_queries + count_queries
 
@@ -122,27 +193,23 @@ def test_logs_and_continues_if_waveform_generation_fails(
     mock_generate_peaks, exception_class, exception_args, exception_kwargs
 ):
     audio_count = 23
+    waveforms = WaveformProvider.generate_waveforms(audio_count)
     return_values = [
-        exception_class(*exception_args, **exception_kwargs)
-        if i == 9
-        else WaveformProvider.generate_waveform()
-        for i in range(audio_count)
+        exception_class(*exception_args, **exception_kwargs) if i == 9 else waveform
+        for i, waveform in enumerate(waveforms)
     ]
     mock_generate_peaks.side_effect = return_values
-    AudioFactory.create_batch(audio_count)
+    _bulk_audio(audio_count)
 
     out = StringIO()
     err = StringIO()
     call_command("generatewaveforms", no_rate_limit=True, stdout=out, stderr=err)
 
-    failed_audio = Audio.objects.exclude(
-        identifier__in=AudioAddOn.objects.filter(
-            waveform_peaks__isnull=False
-        ).values_list("audio_identifier", flat=True)
-    )
+    # Evaluated once rather than queried separately by ``count`` and ``first``
+    failed_audio = list(_audio_without_waveforms().only("identifier"))
 
-    assert failed_audio.count() == 1
-    assert f"Unable to process {failed_audio.first().identifier}" in err.getvalue()
+    assert len(failed_audio) == 1
+    assert f"Unable to process {failed_audio[0].identifier}" in err.getvalue()
 
     assert (
         AudioAddOn.objects.filter(waveform_peaks__isnull=False).count()
@@ -155,11 +222,10 @@ def test_logs_and_continues_if_waveform_generation_fails(
 def test_keyboard_interrupt_should_halt_processing(mock_generate_peaks):
     audio_count = 23
     interrupt_at = 9
+    waveforms = WaveformProvider.generate_waveforms(audio_count)
     return_values = [
-        KeyboardInterrupt()
-        if i == interrupt_at
-        else WaveformProvider.generate_waveform()
-        for i in range(audio_count)
+        KeyboardInterrupt() if i == interrupt_at else waveform
+        for i, waveform in enumerate(waveforms)
     ]
 
     mock_generate_peaks.side_effect = return_values
@@ -169,14 +235,79 @@ def test_keyboard_interrupt_should_halt_processing(mock_generate_peaks):
     err = StringIO()
     call_command("generatewaveforms", no_rate_limit=True, stdout=out, stderr=err)
 
-    failed_audio = Audio.objects.exclude(
-        identifier__in=AudioAddOn.objects.filter(
-            waveform_peaks__isnull=False
-        ).values_list("audio_identifier", flat=True)
-    )
+    failed_audio = _audio_without_waveforms()
 
     assert failed_audio.count() == audio_count - interrupt_at
 
     assert (
         AudioAddOn.objects.filter(waveform_peaks__isnull=False).count() == interrupt_at
     )
+
+
+@pytest.mark.django_db(transaction=True)
+@mock.patch("catalog.api.models.audio.generate_peaks")
+def test_keyboard_interrupt_with_workers_should_halt_processing(mock_generate_peaks):
+    mock_generate_peaks.return_value = _SHARED_WAVEFORM
+    AudioFactory.create_batch(5)
+
+    out = StringIO()
+    err = StringIO()
+    with mock.patch(
+        "catalog.management.commands.generatewaveforms.as_completed",
+        side_effect=KeyboardInterrupt,
+    ):
+        call_command(
+            "generatewaveforms", no_rate_limit=True, workers=2, stdout=out, stderr=err
+        )
+
+    assert "Finished generating waveforms!" in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_estimates_count_of_large_tables():
+    AudioFactory.create_batch(3)
+    with connections["default"].cursor() as cursor:
+        cursor.execute(f"ANALYZE {Audio._meta.db_table}")
+
+    assert estimate_count(Audio) is None
+    with mock.patch(
+        "catalog.management.commands.generatewaveforms.ESTIMATED_COUNT_THRESHOLD", 1
+    ):
+        assert estimate_count(Audio) == 3
+
+
+@pytest.mark.django_db
+def test_estimates_records_to_process_for_large_tables():
+    _bulk_addons(_bulk_audio(3))
+    _bulk_audio(4)
+    with connections["default"].cursor() as cursor:
+        cursor.execute(f"ANALYZE {Audio._meta.db_table}")
+        cursor.execute(f"ANALYZE {AudioAddOn._meta.db_table}")
+
+    with mock.patch(
+        "catalog.management.commands.generatewaveforms.ESTIMATED_COUNT_THRESHOLD", 1
+    ):
+        out, _ = call_generatewaveforms()
+
+    assert "Generating waveforms for 4 records" in out
+    assert_all_audio_have_waveforms()
+
+
+@pytest.mark.django_db
+@mock.patch("catalog.api.models.audio.generate_peaks")
+def test_loads_only_the_fields_needed_for_waveforms(mock_generate_peaks):
+    loaded = []
+
+    def generate_peaks(audio):
+        loaded.append(audio.get_deferred_fields())
+        return _SHARED_WAVEFORM
+
+    mock_generate_peaks.side_effect = generate_peaks
+    AudioFactory.create_batch(2)
+
+    call_command("generatewaveforms", no_rate_limit=True, stdout=StringIO())
+
+    assert len(loaded) == 2
+    for deferred in loaded:
+        assert {"identifier", "url", "duration"}.isdisjoint(deferred)
+        assert "meta_data" in deferred
@@ -1,5 +1,5 @@
-import uuid
 from test.factory.faker import WaveformProvider
+from test.factory.models.media import next_uuid
 from unittest import mock
 
 import pytest
@@ -8,10 +8,9 @@ from catalog.api.models.audio import Audio, AudioAddOn
 
 
 @pytest.fixture
-@pytest.mark.django_db
-def audio_fixture():
+def audio_fixture(db):
     audio = Audio(
-        identifier=uuid.uuid4(),
+        identifier=next_uuid(),
     )
 
     audio.save()
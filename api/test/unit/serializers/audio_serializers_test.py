@@ -1,4 +1,4 @@
-import uuid
+from test.factory.models.media import next_uuid
 
 from rest_framework.request import Request
 from rest_framework.test import APIRequestFactory
@@ -10,10 +10,9 @@ from catalog.api.serializers.audio_serializers import AudioSerializer
 
 
 @pytest.fixture
-@pytest.mark.django_db
-def audio_fixture():
+def audio_fixture(db):
     audio = Audio(
-        identifier=uuid.uuid4(),
+        identifier=next_uuid(),
     )
     audio.save()
     return audio
@@ -1,25 +1,36 @@
 import uuid
 from test.factory.models.oauth2 import AccessTokenFactory
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from django.conf import settings
 from rest_framework.exceptions import NotAuthenticated, ValidationError
+from rest_framework.reverse import reverse
 from rest_framework.test import force_authenticate
 from rest_framework.views import APIView
 
 import pytest
 
-from catalog.api.serializers.audio_serializers import AudioSerializer
-from catalog.api.serializers.image_serializers import ImageSerializer
+from catalog.api.serializers.audio_serializers import (
+    AudioReportRequestSerializer,
+    AudioSerializer,
+)
+from catalog.api.serializers.base import CachedListSerializer
+from catalog.api.serializers.image_serializers import (
+    ImageReportRequestSerializer,
+    ImageSerializer,
+)
 from catalog.api.serializers.media_serializers import MediaSearchRequestSerializer
 
 
-@pytest.fixture
-def access_token():
-    token = AccessTokenFactory.create()
-    token.application.verified = True
-    token.application.save()
-    return token
+@pytest.fixture(scope="module")
+def access_token(django_db_setup, django_db_blocker):
+    # Created once for the module, outside of the transaction of any test, so it is
+    # deleted explicitly; deleting the application cascades to the token.
+    with django_db_blocker.unblock():
+        token = AccessTokenFactory.create(application__verified=True)
+    yield token
+    with django_db_blocker.unblock():
+        token.application.delete()
 
 
 @pytest.fixture
@@ -32,7 +43,7 @@ def hit():
     return hit
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def authed_request(access_token, request_factory):
     request = request_factory.get("/")
 
@@ -84,6 +95,54 @@ def test_page_size_validation(page_size, authenticated, anon_request, authed_req
     assert serializer.is_valid(raise_exception=True)
 
 
+@pytest.mark.parametrize(
+    ("license_type", "expected"),
+    (
+        ("commercial", "by,by-nd,by-sa,cc0,pdm,sampling+"),
+        ("commercial,modification", "by,by-sa,cc0,pdm,sampling+"),
+        ("MODIFICATION,commercial", "by,by-sa,cc0,pdm,sampling+"),
+        pytest.param(
+            "commercial,invalid",
+            None,
+            marks=pytest.mark.raises(exception=ValidationError),
+        ),
+    ),
+)
+def test_license_type_validation(license_type, expected):
+    serializer = MediaSearchRequestSerializer(data={"license_type": license_type})
+    assert serializer.is_valid(raise_exception=True)
+    assert serializer.validated_data["license_type"] == expected
+
+
+@pytest.mark.parametrize(
+    "serializer_class",
+    [
+        AudioReportRequestSerializer,
+        ImageReportRequestSerializer,
+    ],
+)
+@pytest.mark.parametrize(
+    ("reason", "description", "is_valid"),
+    [
+        ("other", None, False),
+        ("other", "too short", False),
+        ("other", "long enough to explain the report", True),
+        ("dmca", None, True),
+    ],
+)
+def test_report_description_validation(serializer_class, reason, description, is_valid):
+    serializer = serializer_class()
+    attrs = {"reason": reason}
+    if description is not None:
+        attrs["description"] = description
+
+    if is_valid:
+        assert serializer.validate(attrs) == attrs
+    else:
+        with pytest.raises(ValidationError):
+            serializer.validate(attrs)
+
+
 @pytest.mark.parametrize(
     "serializer_class",
     [
@@ -100,3 +159,96 @@ def test_media_serializer_adds_license_url_if_missing(
     del hit.license_url  # without the ``del``, the property is dynamically generated
     repr = serializer_class(hit, context={"request": anon_request}).data
     assert repr["license_url"] == "https://creativecommons.org/publicdomain/zero/1.0/"
+
+
+@pytest.mark.parametrize(
+    "serializer_class",
+    [
+        AudioSerializer,
+        ImageSerializer,
+    ],
+)
+def test_media_serializer_fields_are_not_shared_between_instances(
+    anon_request, serializer_class
+):
+    first = serializer_class(context={"request": anon_request})
+    second = serializer_class(context={"request": anon_request})
+
+    assert first.fields.keys() == second.fields.keys()
+    for name, field in first.fields.items():
+        assert field is not second.fields[name]
+        assert field.parent is first
+        assert second.fields[name].parent is second
+    assert first.fields["tags"].child.parent is first.fields["tags"]
+
+
+@pytest.mark.parametrize(
+    "serializer_class",
+    [
+        AudioSerializer,
+        ImageSerializer,
+    ],
+)
+def test_media_serializer_reuses_representation_of_repeated_items(
+    anon_request, hit, serializer_class
+):
+    other_hit = MagicMock(
+        identifier=uuid.uuid4(),
+        license="by",
+        license_version="4.0",
+    )
+    serializer = serializer_class(
+        [hit, other_hit, hit], many=True, context={"request": anon_request}
+    )
+    assert isinstance(serializer, CachedListSerializer)
+
+    with patch.object(
+        serializer.child,
+        "to_representation",
+        wraps=serializer.child.to_representation,
+    ) as to_representation:
+        data = serializer.data
+
+    assert to_representation.call_count == 2
+    assert data[0] == data[2]
+    assert data[0]["id"] != data[1]["id"]
+
+
+@pytest.mark.parametrize(
+    ("serializer_class", "media_type"),
+    [
+        (AudioSerializer, "audio"),
+        (ImageSerializer, "image"),
+    ],
+)
+def test_media_serializer_hyperlinks_match_reversed_urls(
+    anon_request, hit, serializer_class, media_type
+):
+    repr = serializer_class(hit, context={"request": anon_request}).data
+    for field, suffix in [
+        ("detail_url", "detail"),
+        ("related_url", "related"),
+        ("thumbnail", "thumb"),
+    ]:
+        assert repr[field] == reverse(
+            f"{media_type}-{suffix}",
+            kwargs={"identifier": hit.identifier},
+            request=anon_request,
+        )
+
+
+def test_media_serializer_builds_hyperlink_templates_once(anon_request):
+    hits = [
+        MagicMock(identifier=uuid.uuid4(), license="cc0", license_version="1.0")
+        for _ in range(3)
+    ]
+    build_absolute_uri = MagicMock(wraps=anon_request.build_absolute_uri)
+    anon_request.build_absolute_uri = build_absolute_uri
+
+    data = ImageSerializer(hits, many=True, context={"request": anon_request}).data
+
+    assert build_absolute_uri.call_count == 3  # once per hyperlinked field
+    for item, row in zip(hits, data):
+        assert row["detail_url"] == reverse(
+            "image-detail", kwargs={"identifier": item.identifier}, request=anon_request
+        )
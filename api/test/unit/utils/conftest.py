@@ -2,20 +2,27 @@ import json
 from pathlib import Path
 
 import pytest
-from fakeredis import FakeRedis
+from fakeredis import FakeRedis, FakeServer
+
+
+@pytest.fixture(scope="session")
+def session_redis() -> FakeRedis:
+    # Shared by all the tests of the session and emptied before each of them
+    fake_redis = FakeRedis(server=FakeServer())
+    yield fake_redis
+    fake_redis.client().close()
 
 
 @pytest.fixture(autouse=True)
-def redis(monkeypatch) -> FakeRedis:
-    fake_redis = FakeRedis()
+def redis(monkeypatch, session_redis) -> FakeRedis:
+    session_redis.flushdb()
 
     def get_redis_connection(*args, **kwargs):
-        return fake_redis
+        return session_redis
 
     monkeypatch.setattr("django_redis.get_redis_connection", get_redis_connection)
 
-    yield fake_redis
-    fake_redis.client().close()
+    yield session_redis
 
 
 @pytest.fixture(scope="session")
@@ -0,0 +1,46 @@
+import datetime as dt
+from test.factory.models.oauth2 import AccessTokenFactory
+
+import pytest
+
+from catalog.api.utils.oauth2_helper import get_token_info
+
+
+@pytest.fixture
+def access_token():
+    token = AccessTokenFactory.create()
+    token.application.verified = True
+    token.application.save()
+    return token
+
+
+@pytest.mark.django_db
+def test_get_token_info_caches_valid_tokens(access_token, django_assert_num_queries):
+    expected = (str(access_token.application.client_id), "standard", True)
+
+    with django_assert_num_queries(1):
+        assert get_token_info(access_token.token) == expected
+    with django_assert_num_queries(0):
+        assert get_token_info(access_token.token) == expected
+
+
+@pytest.mark.django_db
+def test_get_token_info_invalidated_on_application_change(access_token):
+    get_token_info(access_token.token)
+
+    access_token.application.rate_limit_model = "enhanced"
+    access_token.application.save()
+
+    assert get_token_info(access_token.token)[1] == "enhanced"
+
+
+@pytest.mark.django_db
+def test_get_token_info_does_not_cache_expired_tokens(
+    access_token, django_assert_num_queries
+):
+    access_token.expires = dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=1)
+    access_token.save()
+
+    for _ in range(2):
+        with django_assert_num_queries(1):
+            assert get_token_info(access_token.token) == (None, None, None)
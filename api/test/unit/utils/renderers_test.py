@@ -0,0 +1,37 @@
+import datetime as dt
+import uuid
+from decimal import Decimal
+
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.serializer_helpers import ReturnDict
+
+import pytest
+
+from catalog.api.utils.renderers import ORJSONRenderer
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        None,
+        {"result_count": 1, "results": [{"title": "Café", "tags": ["a", "b"]}]},
+        ReturnDict({"id": uuid.uuid4(), "score": Decimal("1.5")}, serializer=None),
+        {
+            "created_on": dt.datetime(
+                2022, 1, 1, 12, 30, 1, 123456, tzinfo=dt.timezone.utc
+            )
+        },
+        {"detail": gettext_lazy("Not found."), 1: ("a",)},
+    ],
+)
+def test_orjson_renderer_matches_json_renderer(data):
+    assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+def test_orjson_renderer_indents_like_json_renderer():
+    data = {"results": [{"title": "Title"}]}
+    context = {"indent": 4}
+    assert ORJSONRenderer().render(data, renderer_context=context) == (
+        JSONRenderer().render(data, renderer_context=context)
+    )
@@ -1,4 +1,5 @@
 from test.factory.models.oauth2 import AccessTokenFactory
+from unittest.mock import MagicMock
 
 from rest_framework.test import force_authenticate
 from rest_framework.views import APIView
@@ -14,18 +15,18 @@ from catalog.api.utils.throttle import (
 
 
 @pytest.fixture(autouse=True)
-def redis(monkeypatch) -> FakeRedis:
-    fake_redis = FakeRedis()
+def redis(monkeypatch, session_redis) -> FakeRedis:
+    session_redis.flushdb()
 
     def get_redis_connection(*args, **kwargs):
-        return fake_redis
+        return session_redis
 
     monkeypatch.setattr(
         "catalog.api.utils.throttle.get_redis_connection", get_redis_connection
     )
+    monkeypatch.setattr("django_redis.get_redis_connection", get_redis_connection)
 
-    yield fake_redis
-    fake_redis.client().close()
+    yield session_redis
 
 
 @pytest.fixture
@@ -124,3 +125,40 @@ def test_abstract_oauth2_id_rate_throttle_does_not_apply_if_token_app_rate_limit
     )
     access_token.application.save()
     assert throttle.get_cache_key(view.initialize_request(authed_request), view) is None
+
+
+@pytest.mark.django_db
+def test_throttles_look_up_token_info_once_per_request(
+    authed_request, view, django_assert_num_queries
+):
+    request = view.initialize_request(authed_request)
+    throttle_classes = [
+        *AbstractAnonRateThrottle.__subclasses__(),
+        *AbstractOAuth2IdRateThrottle.__subclasses__(),
+    ]
+    with django_assert_num_queries(1):
+        for throttle_class in throttle_classes:
+            throttle_class().get_cache_key(request, view)
+
+
+@pytest.mark.django_db
+def test_throttles_do_not_look_up_token_info_for_anonymous_request(
+    request_factory, view, django_assert_num_queries
+):
+    request = view.initialize_request(request_factory.get("/"))
+    with django_assert_num_queries(0):
+        for throttle_class in AbstractOAuth2IdRateThrottle.__subclasses__():
+            assert throttle_class().get_cache_key(request, view) is None
+
+
+@pytest.mark.django_db
+def test_anon_rate_throttles_check_ip_whitelist_once_per_request(
+    redis, request_factory, view, monkeypatch
+):
+    request = view.initialize_request(request_factory.get("/"))
+    sismember = MagicMock(wraps=redis.sismember)
+    monkeypatch.setattr(redis, "sismember", sismember)
+    for throttle_class in AbstractAnonRateThrottle.__subclasses__():
+        assert throttle_class().get_cache_key(request, view) is not None
+
+    sismember.assert_called_once_with("ip-whitelist", request.META["REMOTE_ADDR"])
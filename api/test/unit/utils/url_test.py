@@ -0,0 +1,16 @@
+import pytest
+
+from catalog.api.utils.url import add_protocol
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://example.com/path", "https://example.com/path"),
+        ("http://example.com/path", "http://example.com/path"),
+        ("example.com/path", "https://example.com/path"),
+        (None, None),
+    ],
+)
+def test_add_protocol(url, expected):
+    assert add_protocol(url) == expected
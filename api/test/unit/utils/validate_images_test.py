@@ -1,15 +1,28 @@
 import asyncio
+from collections import defaultdict, deque
 from unittest import mock
 
 import aiohttp
 import pook
+import pytest
 
+from catalog.api.utils import validate_images as validate_images_module
 from catalog.api.utils.validate_images import HEADERS, validate_images
 
 
+@pytest.fixture(autouse=True)
+def host_latencies():
+    # The latencies recorded by one test would otherwise shorten the timeouts of the
+    # next ones.
+    validate_images_module._host_latencies.clear()
+    yield validate_images_module._host_latencies
+    validate_images_module._host_latencies.clear()
+
+
 @mock.patch.object(aiohttp, "ClientSession", wraps=aiohttp.ClientSession)
 @pook.on
-def test_sends_user_agent(wrapped_client_session: mock.AsyncMock):
+def test_sends_user_agent(wrapped_client_session: mock.AsyncMock, monkeypatch):
+    monkeypatch.setattr(validate_images_module, "_session", None)
     query_hash = "test_sends_user_agent"
     results = [object() for _ in range(40)]
     image_urls = [f"https://example.org/{i}" for i in range(len(results))]
@@ -29,7 +42,30 @@ def test_sends_user_agent(wrapped_client_session: mock.AsyncMock):
     for url in image_urls:
         assert url in requested_urls
 
-    wrapped_client_session.assert_called_once_with(headers=HEADERS, timeout=mock.ANY)
+    wrapped_client_session.assert_called_once_with(
+        headers=HEADERS, timeout=mock.ANY, connector=mock.ANY
+    )
+    validate_images_module._close_session()
+
+
+@mock.patch.object(aiohttp, "ClientSession", wraps=aiohttp.ClientSession)
+@pook.on
+def test_reuses_client_session(wrapped_client_session: mock.MagicMock, monkeypatch):
+    monkeypatch.setattr(validate_images_module, "_session", None)
+    pook.head(pook.regex(r"https://example.org/\d")).times(2).reply(200)
+
+    for i in range(2):
+        validate_images(
+            f"test_reuses_client_session_{i}",
+            0,
+            [object()],
+            [f"https://example.org/{i}"],
+        )
+
+    wrapped_client_session.assert_called_once_with(
+        headers=HEADERS, timeout=mock.ANY, connector=mock.ANY
+    )
+    validate_images_module._close_session()
 
 
 def test_handles_timeout():
@@ -56,3 +92,112 @@ def test_handles_timeout():
     # if the results are timing out then they're considered dead and discarded
     # so should not appear in the final list of results.
     assert len(results) == 0
+
+
+@mock.patch("catalog.api.utils.validate_images.save_query_mask")
+@pook.on
+def test_removes_only_broken_images(save_query_mask: mock.MagicMock):
+    statuses = [200, 404, 429, 500, 403, 200]
+    results = [{"identifier": i} for i in range(len(statuses))]
+    image_urls = [f"https://example.org/status/{i}" for i in range(len(statuses))]
+    for url, status in zip(image_urls, statuses):
+        pook.head(url).reply(status)
+
+    validate_images("test_removes_only_broken_images", 0, results, image_urls)
+
+    assert results == [{"identifier": i} for i in (0, 2, 4, 5)]
+    save_query_mask.assert_called_once_with(
+        "test_removes_only_broken_images", [1, 0, 1, 0, 1, 1], mock.ANY
+    )
+
+
+@pook.on
+def test_caches_statuses_with_expiry(redis):
+    image_urls = ["https://example.org/ok", "https://example.org/missing"]
+    pook.head(image_urls[0]).reply(200)
+    pook.head(image_urls[1]).reply(404)
+
+    validate_images(
+        "test_caches_statuses_with_expiry",
+        0,
+        [{"identifier": i} for i in range(len(image_urls))],
+        image_urls,
+    )
+
+    for url, status in zip(image_urls, (b"200", b"404")):
+        assert redis.get(f"valid:{url}") == status
+        assert redis.ttl(f"valid:{url}") > 0
+
+
+@pook.on
+def test_saves_statuses_and_mask_in_one_round_trip(redis, monkeypatch):
+    image_urls = ["https://example.org/one-trip"]
+    pook.head(image_urls[0]).reply(404)
+    pipeline = mock.MagicMock(wraps=redis.pipeline)
+    monkeypatch.setattr(redis, "pipeline", pipeline)
+
+    validate_images("test_one_round_trip", 0, [{"identifier": 0}], image_urls)
+
+    pipeline.assert_called_once()
+    assert redis.get(f"valid:{image_urls[0]}") == b"404"
+    assert redis.lrange("test_one_round_trip:dead_link_mask", 0, -1) == [b"0"]
+
+
+def test_keeps_statuses_received_before_timeout(monkeypatch):
+    async def head(url, session):
+        if url.endswith("slow"):
+            await asyncio.sleep(1)
+        return url, 200
+
+    monkeypatch.setattr(validate_images_module, "_head", head)
+    monkeypatch.setattr(validate_images_module, "HEAD_REQUESTS_TIMEOUT", 0.1)
+    results = [{"identifier": "fast"}, {"identifier": "slow"}]
+    image_urls = ["https://example.org/fast", "https://example.org/slow"]
+
+    validate_images(
+        "test_keeps_statuses_received_before_timeout", 0, results, image_urls
+    )
+
+    assert results == [{"identifier": "fast"}]
+
+
+@pytest.mark.parametrize(
+    "latencies, expected",
+    [
+        ([], 2.0),
+        ([0.1] * 10, 2.0),  # too few samples to trust
+        ([0.1] * 100, 0.5),
+        ([0.4] * 100, 0.8),
+        ([0.1] * 90 + [3.0] * 10, 2.0),
+    ],
+)
+def test_get_head_timeout(latencies, expected, monkeypatch):
+    host_latencies = defaultdict(deque, {"example.org": deque(latencies)})
+    monkeypatch.setattr(validate_images_module, "_host_latencies", host_latencies)
+
+    assert validate_images_module._get_head_timeout("example.org") == expected
+
+
+@pytest.mark.parametrize(
+    "latencies, is_kept",
+    [
+        # Timed out at the full ``HEAD_TIMEOUT``
+        ([], False),
+        # Timed out at a shorter, adaptive timeout
+        ([0.1] * 100, True),
+    ],
+)
+def test_only_full_timeouts_mark_images_as_dead(
+    latencies, is_kept, redis, host_latencies
+):
+    host_latencies["example.org"].extend(latencies)
+    results = [{"identifier": 0}]
+    image_urls = ["https://example.org/slow"]
+
+    with mock.patch(
+        "aiohttp.client.ClientSession._request", side_effect=asyncio.TimeoutError
+    ):
+        validate_images("test_only_full_timeouts", 0, results, image_urls)
+
+    assert (results == [{"identifier": 0}]) is is_kept
+    assert (redis.get(f"valid:{image_urls[0]}") is None) is is_kept
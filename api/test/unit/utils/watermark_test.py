@@ -1,5 +1,4 @@
 import json
-import struct
 from collections.abc import Callable
 from dataclasses import dataclass
 from io import BytesIO
@@ -7,10 +6,24 @@ from pathlib import Path
 from unittest import mock
 
 import pytest
-from PIL import Image
+from PIL import Image, ImageDraw
 from requests import Request, Response
 
-from catalog.api.utils.watermark import HEADERS, _open_image, watermark
+from catalog.api.utils.watermark import (
+    HEADERS,
+    HEIGHT,
+    WIDTH,
+    UpstreamWatermarkException,
+    _fit_in_width,
+    _get_attribution_stamp,
+    _get_font,
+    _layout_attribution,
+    _open_image,
+    _print_attribution_on_image,
+    _session,
+    _smaller_dimension,
+    watermark,
+)
 
 
 _MOCK_IMAGE_PATH = Path(__file__).parent / ".." / ".." / "factory"
@@ -31,6 +44,7 @@ class RequestsFixture:
         res.url = req.url
         res.status_code = 200
         res._content = _MOCK_IMAGE_BYTES
+        res._content_consumed = True
         return res
 
 
@@ -38,13 +52,14 @@ class RequestsFixture:
 def requests(monkeypatch) -> RequestsFixture:
     fixture = RequestsFixture([])
 
-    def requests_get(url, **kwargs):
-        req = Request(method="GET", url=url, **kwargs)
+    def requests_get(url, stream=False, timeout=None, headers=None, **kwargs):
+        headers = {**_session.headers, **(headers or {})}
+        req = Request(method="GET", url=url, headers=headers, **kwargs)
         fixture.requests.append(req)
         response = fixture.response_factory(req)
         return response
 
-    monkeypatch.setattr("requests.get", requests_get)
+    monkeypatch.setattr("catalog.api.utils.watermark._session.get", requests_get)
 
     return fixture
 
@@ -54,20 +69,166 @@ def test_sends_UA_header(requests):
 
     assert len(requests.requests) > 0
     for r in requests.requests:
-        assert r.headers == HEADERS
+        assert r.headers["User-Agent"] == HEADERS["User-Agent"]
 
 
-def test_catch_struct_errors_from_piexif(requests):
+def test_open_image_returns_raw_exif_bytes(requests):
     img_mock = Image.open(BytesIO(_MOCK_IMAGE_BYTES))
-    img_mock.info["exif"] = "bad_info"
+    img_mock.info["exif"] = b"Exif\x00\x00raw"
 
-    with mock.patch("PIL.Image.open") as open_mock, mock.patch(
-        "piexif.load"
-    ) as load_mock:
+    with mock.patch("PIL.Image.open") as open_mock:
+        open_mock.return_value = img_mock
+
+        img, exif = _open_image("http://example.com/")
+
+    assert img is not None
+    assert exif == b"Exif\x00\x00raw"
+
+
+def _respond_with_headers(requests, headers):
+    def response_factory(req):
+        res = RequestsFixture._default_response_factory(req)
+        res.headers.update(headers)
+        return res
+
+    requests.response_factory = response_factory
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {"Content-Type": "text/html; charset=utf-8"},
+        {"Content-Type": "application/json"},
+        {"Content-Type": "video/mp4"},
+        {"Content-Type": "image/jpeg", "Content-Length": "999999999"},
+    ],
+)
+def test_open_image_refuses_non_images_and_oversized_images(requests, headers):
+    _respond_with_headers(requests, headers)
+
+    with pytest.raises(UpstreamWatermarkException):
+        _open_image("http://example.com/")
+
+
+@pytest.mark.parametrize(
+    "content_type",
+    ["image/jpeg", "image/tiff", "application/octet-stream", "binary/octet-stream"],
+)
+def test_open_image_leaves_possible_images_to_pillow(requests, content_type):
+    _respond_with_headers(requests, {"Content-Type": content_type})
+
+    img, _ = _open_image("http://example.com/")
+
+    assert img.format == "JPEG"
+
+
+def test_open_image_refuses_oversized_image_without_content_length(requests, settings):
+    settings.WATERMARK_MAX_BYTES = len(_MOCK_IMAGE_BYTES) - 1
+
+    with pytest.raises(UpstreamWatermarkException):
+        _open_image("http://example.com/")
+
+
+def test_open_image_refuses_undecodable_image(requests):
+    def response_factory(req):
+        res = RequestsFixture._default_response_factory(req)
+        res._content = b"not an image"
+        return res
+
+    requests.response_factory = response_factory
+
+    with pytest.raises(UpstreamWatermarkException):
+        _open_image("http://example.com/")
+
+
+def test_open_image_without_exif(requests):
+    img_mock = Image.open(BytesIO(_MOCK_IMAGE_BYTES))
+    img_mock.info.pop("exif", None)
+
+    with mock.patch("PIL.Image.open") as open_mock:
         open_mock.return_value = img_mock
-        load_mock.side_effect = struct.error("unpack requires a buffer of 2 bytes")
 
         img, exif = _open_image("http://example.com/")
 
     assert img is not None
     assert exif is None
+
+
+@pytest.mark.parametrize(
+    "width, height, expected",
+    [
+        (400, 400, 0),
+        (399, 400, WIDTH),
+        (400, 399, HEIGHT),
+        (10, 10, WIDTH | HEIGHT),
+    ],
+)
+def test_smaller_dimension(width, height, expected):
+    assert _smaller_dimension(width, height) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '"A rather long title for a photograph" by Someone is licensed under CC BY 4.0.',
+        "Short",
+        "Firstparagraph\nsecond paragraph that wraps around",
+        "Averyveryveryveryveryveryverylongwordwithoutanyspaces and more",
+    ],
+)
+def test_fit_in_width(text):
+    font = _get_font(16)
+    max_width = 150
+
+    fitted = _fit_in_width(text, font, max_width)
+
+    for line in fitted.split("\n"):
+        assert font.getlength(line) <= max_width
+    assert fitted.replace("\n", "").replace(" ", "") == text.replace("\n", "").replace(
+        " ", ""
+    )
+
+
+def test_fit_in_width_keeps_characters_wider_than_the_space():
+    assert _fit_in_width("W W", _get_font(16), 1) == "W\nW"
+
+
+def test_layout_attribution_is_cached():
+    _layout_attribution.cache_clear()
+    text = '"A rather long title for a photograph" by Someone is licensed under CC BY.'
+
+    layout = _layout_attribution(text, 16, 150)
+
+    assert layout == (_fit_in_width(text, _get_font(16), 150), layout[1])
+    draw = ImageDraw.Draw(Image.new("RGB", (0, 0)))
+    assert (
+        layout[1] == draw.multiline_textbbox((0, 0), layout[0], font=_get_font(16))[3]
+    )
+    assert _layout_attribution(text, 16, 150) is layout
+    assert _layout_attribution.cache_info().hits == 1
+
+
+def test_attribution_stamp_matches_drawn_text():
+    text = '"A rather long title"\nby Someone is licensed under CC BY 4.0.'
+    font = _get_font(16)
+    drawn = Image.new("RGB", (400, 100), "white")
+    ImageDraw.Draw(drawn).multiline_text((10, 10), text, font=font, fill="black")
+
+    stamped = Image.new("RGB", (400, 100), "white")
+    stamped.paste("black", (10, 10), _get_attribution_stamp(text, 16))
+
+    assert stamped.tobytes() == drawn.tobytes()
+
+
+@pytest.mark.parametrize("mode", ["RGB", "L", "RGBA"])
+def test_print_attribution_on_image_frames_image(mode):
+    img = Image.new(mode, (500, 600), "black")
+
+    frame = _print_attribution_on_image(img, _MOCK_IMAGE_INFO)
+
+    margin = 20  # 4% of the smaller dimension
+    assert frame.mode == "RGB"
+    assert frame.width == 500 + 2 * margin
+    assert frame.height > 600 + 3 * margin
+    assert frame.getpixel((0, 0)) == (255, 255, 255)
+    assert frame.getpixel((margin, margin)) == (0, 0, 0)
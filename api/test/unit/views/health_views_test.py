@@ -3,6 +3,15 @@ from unittest import mock
 import pook
 import pytest
 
+from catalog.api.views import health_views
+
+
+@pytest.fixture(autouse=True)
+def clear_es_health_cache():
+    health_views._es_health_cache = None
+    yield
+    health_views._es_health_cache = None
+
 
 def mock_health_response(status="green", timed_out=False):
     return (
@@ -62,3 +71,34 @@ def test_health_check_es_all_good(api_client):
     pook.off()
 
     assert res.status_code == 200
+
+
+@pytest.mark.django_db
+def test_health_check_es_reuses_recent_response(api_client):
+    mock_health_response(status="green")
+    pook.on()
+    # The mock only replies once, so the second check must come from the cache
+    first = api_client.get("/healthcheck/", data={"check_es": True})
+    second = api_client.get("/healthcheck/", data={"check_es": True})
+    pook.off()
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+
+
+@pytest.mark.django_db
+def test_health_check_es_queries_again_after_ttl(api_client):
+    mock_health_response(status="green")
+    mock_health_response(status="red")
+    pook.on()
+    first = api_client.get("/healthcheck/", data={"check_es": True})
+    checked_at, es_health = health_views._es_health_cache
+    health_views._es_health_cache = (
+        checked_at - health_views.ES_HEALTH_CACHE_TTL,
+        es_health,
+    )
+    second = api_client.get("/healthcheck/", data={"check_es": True})
+    pook.off()
+
+    assert first.status_code == 200
+    assert second.status_code == 503
@@ -28,6 +28,7 @@ class RequestsFixture:
         res.url = req.url
         res.status_code = 200
         res._content = _MOCK_IMAGE_BYTES
+        res._content_consumed = True
         return res
 
 
@@ -35,13 +36,14 @@ class RequestsFixture:
 def requests(monkeypatch) -> RequestsFixture:
     fixture = RequestsFixture([])
 
-    def requests_get(url, **kwargs):
+    def requests_get(url, stream=False, timeout=None, **kwargs):
         req = Request(method="GET", url=url, **kwargs)
         fixture.requests.append(req)
         response = fixture.response_factory(req)
         return response
 
     monkeypatch.setattr("requests.get", requests_get)
+    monkeypatch.setattr("catalog.api.utils.watermark._session.get", requests_get)
 
     return fixture
 
@@ -56,3 +58,37 @@ def test_oembed_sends_ua_header(api_client, requests):
     assert len(requests.requests) > 0
     for r in requests.requests:
         assert r.headers == ImageViewSet.OEMBED_HEADERS
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("draw_frame, is_original", [(False, True), (True, False)])
+def test_watermark_sends_original_jpeg_without_frame(
+    api_client, settings, draw_frame, is_original
+):
+    settings.WATERMARK_ENABLED = True
+    image = ImageFactory.create(license="by", license_version="4.0")
+    res = api_client.get(
+        f"/v1/images/{image.identifier}/watermark/",
+        data={"watermark": draw_frame, "embed_metadata": False},
+    )
+
+    assert res.status_code == 200
+    assert res["Content-Type"] == "image/jpeg"
+    assert (res.content == _MOCK_IMAGE_BYTES) is is_original
+
+
+@pytest.mark.django_db
+def test_watermark_fails_cleanly_for_non_image(api_client, requests, settings):
+    settings.WATERMARK_ENABLED = True
+    image = ImageFactory.create()
+
+    def response_factory(req):
+        res = RequestsFixture._default_response_factory(req)
+        res.headers["Content-Type"] = "text/html"
+        return res
+
+    requests.response_factory = response_factory
+
+    res = api_client.get(f"/v1/images/{image.identifier}/watermark/")
+
+    assert res.status_code == 424
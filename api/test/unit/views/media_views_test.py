@@ -38,6 +38,39 @@ def test_list_query_count(api_client, media_type, media_factory):
     assert res.status_code == 200
 
 
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "media_type, media_factory",
+    [
+        ("images", ImageFactory),
+        ("audio", AudioFactory),
+    ],
+)
+def test_related_query_count(api_client, media_type, media_factory):
+    num_results = 10
+    controller_ret = (
+        [
+            MagicMock(identifier=str(media_factory.create().identifier))
+            for _ in range(num_results)
+        ],  # results
+        num_results,
+    )
+    media = media_factory.create()
+    with patch(
+        "catalog.api.views.media_views.search_controller",
+        related_media=MagicMock(return_value=controller_ret),
+    ), patch(
+        "catalog.api.serializers.media_serializers.search_controller",
+        get_sources=MagicMock(return_value={}),
+    ), pytest_django.asserts.assertNumQueries(
+        1
+    ):
+        res = api_client.get(f"/v1/{media_type}/{media.identifier}/related/")
+
+    assert res.status_code == 200
+    assert len(res.data["results"]) == num_results
+
+
 @pytest.mark.django_db
 @pytest.mark.parametrize(
     ("media_type", "media_factory"),
@@ -1,5 +1,29 @@
 from test.constants import API_URL, KNOWN_ENVS
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+SESSION = requests.Session()
+"""
+Shared by all integration tests so that connections to the API are kept alive.
+
+Transient gateway errors from the deployment under test are retried.
+"""
+SESSION.verify = False
+for _prefix in ("http://", "https://"):
+    SESSION.mount(
+        _prefix,
+        HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504]
+            ),
+        ),
+    )
+
 
 def show_env_name():
     env_name = KNOWN_ENVS.get(API_URL, "unknown")
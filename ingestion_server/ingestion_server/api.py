@@ -1,14 +1,13 @@
 """A small RPC API server for scheduling data refresh and indexing tasks."""
 
+import json
 import logging
 import sys
-import time
 import uuid
 from multiprocessing import Process, Value
-from urllib.parse import urlparse
 
 import falcon
-from falcon.media.validators import jsonschema
+import jsonschema
 
 from ingestion_server import slack
 from ingestion_server.constants.media_types import MEDIA_TYPES, MediaType
@@ -24,16 +23,79 @@ CALLBACK_URL = "callback_url"
 SINCE_DATE = "since_date"
 
 
+TASK_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "model": {"type": "string", "enum": MEDIA_TYPES},
+        "action": {
+            "type": "string",
+            "enum": list(task_type.name for task_type in TaskTypes),
+        },
+        # Accepts all forms described in the PostgreSQL documentation:
+        # https://www.postgresql.org/docs/current/datatype-datetime.html
+        "since_date": {"type": "string"},
+        "index_suffix": {"type": "string"},
+        "alias": {"type": "string"},
+        "force_delete": {"type": "boolean"},
+    },
+    "required": ["model", "action"],
+    "allOf": [
+        {
+            "if": {"properties": {"action": {"const": TaskTypes.POINT_ALIAS.name}}},
+            "then": {"required": ["index_suffix", "alias"]},
+        },
+        {
+            "if": {"properties": {"action": {"const": TaskTypes.PROMOTE.name}}},
+            "then": {"required": ["index_suffix", "alias"]},
+        },
+        # TODO: delete eventually, rarely used
+        {
+            "if": {"properties": {"action": {"const": TaskTypes.UPDATE_INDEX.name}}},
+            "then": {"required": ["index_suffix", "since_date"]},
+        },
+        {
+            "if": {"properties": {"action": {"const": TaskTypes.DELETE_INDEX.name}}},
+            "then": {
+                "oneOf": [
+                    {"required": ["alias"]},
+                    {"required": ["index_suffix"]},
+                ]
+            },
+        },
+    ],
+}
+# Validating with ``jsonschema.validate`` checks the schema itself against the
+# metaschema before checking the instance, on every request, so the validator is
+# built once instead.
+_TaskValidator = jsonschema.validators.validator_for(TASK_SCHEMA)
+_TaskValidator.check_schema(TASK_SCHEMA)
+_task_validator = _TaskValidator(TASK_SCHEMA, format_checker=jsonschema.FormatChecker())
+
+
 class HealthResource:
+    # The response never changes, so it is serialized once rather than on every probe
+    BODY = json.dumps({"status": "200 OK"}).encode()
+
     @staticmethod
     def on_get(_, resp):
         resp.status = falcon.HTTP_200
-        resp.media = {"status": "200 OK"}
+        resp.content_type = falcon.MEDIA_JSON
+        resp.data = HealthResource.BODY
 
 
 class StatResource:
-    @staticmethod
-    def on_get(_, res, name):
+    def __init__(self):
+        self._elasticsearch = None
+
+    @property
+    def elasticsearch(self):
+        """Connect to Elasticsearch on first use and reuse the client afterwards."""
+
+        if self._elasticsearch is None:
+            self._elasticsearch = elasticsearch_connect()
+        return self._elasticsearch
+
+    def on_get(self, _, res, name):
         """
         Handle an incoming GET request and provides info about the given index or alias.
 
@@ -43,8 +105,7 @@ class StatResource:
         :return: the information about the index or alias
         """
 
-        elasticsearch = elasticsearch_connect()
-        stat = get_stat(elasticsearch, name)
+        stat = get_stat(self.elasticsearch, name)
         res.status = falcon.HTTP_200
         res.media = stat._asdict()
 
@@ -58,60 +119,6 @@ class BaseTaskResource:
 
 
 class TaskResource(BaseTaskResource):
-    @staticmethod
-    def _get_base_url(req):
-        parsed = urlparse(req.url)
-        return parsed.scheme + "://" + parsed.netloc
-
-    @jsonschema.validate(
-        req_schema={
-            "type": "object",
-            "properties": {
-                "model": {"type": "string", "enum": MEDIA_TYPES},
-                "action": {
-                    "type": "string",
-                    "enum": list(task_type.name for task_type in TaskTypes),
-                },
-                # Accepts all forms described in the PostgreSQL documentation:
-                # https://www.postgresql.org/docs/current/datatype-datetime.html
-                "since_date": {"type": "string"},
-                "index_suffix": {"type": "string"},
-                "alias": {"type": "string"},
-                "force_delete": {"type": "boolean"},
-            },
-            "required": ["model", "action"],
-            "allOf": [
-                {
-                    "if": {
-                        "properties": {"action": {"const": TaskTypes.POINT_ALIAS.name}}
-                    },
-                    "then": {"required": ["index_suffix", "alias"]},
-                },
-                {
-                    "if": {"properties": {"action": {"const": TaskTypes.PROMOTE.name}}},
-                    "then": {"required": ["index_suffix", "alias"]},
-                },
-                # TODO: delete eventually, rarely used
-                {
-                    "if": {
-                        "properties": {"action": {"const": TaskTypes.UPDATE_INDEX.name}}
-                    },
-                    "then": {"required": ["index_suffix", "since_date"]},
-                },
-                {
-                    "if": {
-                        "properties": {"action": {"const": TaskTypes.DELETE_INDEX.name}}
-                    },
-                    "then": {
-                        "oneOf": [
-                            {"required": ["alias"]},
-                            {"required": ["index_suffix"]},
-                        ]
-                    },
-                },
-            ],
-        }
-    )
     def on_post(self, req, res):
         """
         Handle an incoming POST request and schedule the specified task.
@@ -121,6 +128,10 @@ class TaskResource(BaseTaskResource):
         """
 
         body = req.get_media()
+        if error := jsonschema.exceptions.best_match(_task_validator.iter_errors(body)):
+            raise falcon.MediaValidationError(
+                title="Request data failed validation", description=error.message
+            )
 
         # Generated fields
         task_id = uuid.uuid4().hex  # no hyphens
@@ -175,13 +186,14 @@ class TaskResource(BaseTaskResource):
             is_bad_request=is_bad_request,
         )
 
-        base_url = self._get_base_url(req)
-        status_url = f"{base_url}/task/{task_id}"
+        status_url = f"{req.scheme}://{req.netloc}/task/{task_id}"
 
-        # Give the task a moment to start so we can detect immediate failure.
+        # Give the task a moment to start so we can detect immediate failure. Joining
+        # returns as soon as the process exits, so tasks that fail or complete right
+        # away are reported without waiting for the full 100ms.
         # TODO: Use IPC to detect if the job launched successfully instead
         # of giving it 100ms to crash. This is prone to race conditions.
-        time.sleep(0.1)
+        task.join(timeout=0.1)
         if task.is_alive():
             res.status = falcon.HTTP_202
             res.media = {
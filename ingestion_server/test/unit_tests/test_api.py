@@ -0,0 +1,101 @@
+from unittest import mock
+
+import pytest
+from falcon.testing import TestClient
+
+from ingestion_server.api import create_api
+from ingestion_server.es_helpers import Stat
+
+
+@pytest.fixture
+def client():
+    return TestClient(create_api(log=False))
+
+
+@pytest.mark.parametrize(
+    "body, description",
+    [
+        # Missing required field
+        ({"action": "REINDEX"}, "'model' is a required property"),
+        # Unknown action
+        ({"model": "image", "action": "FLY"}, "'FLY' is not one of"),
+        # Action-specific required field
+        (
+            {"model": "image", "action": "POINT_ALIAS", "index_suffix": "a"},
+            "'alias' is a required property",
+        ),
+    ],
+)
+def test_task_rejects_invalid_body(client, body, description):
+    res = client.simulate_post("/task", json=body)
+
+    assert res.status_code == 400
+    assert res.json["title"] == "Request data failed validation"
+    assert description in res.json["description"]
+
+
+def _fail_with_bad_request(is_bad_request, **kwargs):
+    is_bad_request.value = 1
+
+
+def _complete(progress, **kwargs):
+    progress.value = 100
+
+
+@pytest.mark.parametrize(
+    "task, status, message",
+    [
+        (_fail_with_bad_request, 400, "Failed during task execution"),
+        (_complete, 202, "Successfully completed task"),
+    ],
+)
+def test_task_reports_tasks_that_end_immediately(
+    client, monkeypatch, task, status, message
+):
+    monkeypatch.setattr("ingestion_server.api.perform_task", task)
+
+    res = client.simulate_post(
+        "/task", json={"model": "image", "action": "DELETE_INDEX", "alias": "image"}
+    )
+
+    assert res.status_code == status
+    assert res.json["message"].startswith(message)
+
+
+def test_stat_reuses_elasticsearch_client(client, monkeypatch):
+    connect = mock.Mock()
+    monkeypatch.setattr("ingestion_server.api.elasticsearch_connect", connect)
+    monkeypatch.setattr(
+        "ingestion_server.api.get_stat",
+        lambda es, name: Stat(exists=True, is_alias=False, alt_names=[]),
+    )
+
+    for _ in range(2):
+        res = client.simulate_get("/stat/image")
+        assert res.status_code == 200
+        assert res.json == {"exists": True, "is_alias": False, "alt_names": []}
+
+    connect.assert_called_once()
+
+
+def test_health(client):
+    res = client.simulate_get("/")
+
+    assert res.status_code == 200
+    assert res.headers["content-type"] == "application/json"
+    assert res.json == {"status": "200 OK"}
+
+
+def test_task_links_to_its_status(client, monkeypatch):
+    monkeypatch.setattr("ingestion_server.api.perform_task", _complete)
+
+    res = client.simulate_post(
+        "/task",
+        json={"model": "image", "action": "DELETE_INDEX", "alias": "image"},
+        host="ingestion.local",
+        port=8001,
+    )
+
+    assert res.json["status_check"] == (
+        f"http://ingestion.local:8001/task/{res.json['task_id']}"
+    )